@@ -4,8 +4,9 @@ import sys
 import subprocess
 import psutil
 import json
+import time
 from pathlib import Path
-from typing import Dict, Optional, List, Tuple
+from typing import Callable, Dict, Optional, List, Tuple
 from app.core.config_manager import ConfigManager
 from app.core.core_utils import debug_print, get_resource_path
 
@@ -217,6 +218,39 @@ class AppManager:
         except Exception as e:
             return False, f"Error closing application: {e}"
     
+    def wait_until_terminated(self, app_name: str, timeout: float = 3.0, poll: float = 0.05,
+                              should_cancel: Optional[Callable[[], bool]] = None) -> bool:
+        """Wait until all processes of an application have exited.
+        
+        Args:
+            app_name: Application whose processes to wait for
+            timeout: Maximum time to wait in seconds
+            poll: Interval between liveness checks in seconds
+            should_cancel: Optional callable; waiting stops early when it returns True
+        
+        Returns:
+            True if no matching process is left, False on timeout or cancellation
+        """
+        app_config = self.config.get("applications", {}).get(app_name, {})
+        processes = app_config.get("process_names", [])
+        
+        try:
+            alive = [proc for proc in psutil.process_iter(['name'])
+                     if any(p.lower() in proc.info['name'].lower() for p in processes)]
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            alive = []
+        
+        deadline = time.monotonic() + timeout
+        while alive:
+            if should_cancel and should_cancel():
+                return False
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            _, alive = psutil.wait_procs(alive, timeout=min(poll, remaining))
+        
+        return True
+    
     def get_app_info(self, app_name: str) -> Optional[Dict]:
         """Get information about specific app."""
         if not self.detected_apps:
@@ -2,6 +2,7 @@
 import os
 import sys
 import json
+import stat
 import subprocess
 from pathlib import Path
 from datetime import datetime
@@ -63,6 +64,70 @@ def ensure_directory(directory_path: str) -> bool:
         return False
 
 
+def is_reparse_point(entry: os.DirEntry) -> bool:
+    """Whether a directory entry is a Windows junction or other reparse point."""
+    if sys.platform != 'win32':
+        return False
+    # DirEntry.stat() is served from the directory listing on Windows
+    attributes = entry.stat(follow_symlinks=False).st_file_attributes
+    return bool(attributes & stat.FILE_ATTRIBUTE_REPARSE_POINT)
+
+
+def rmtree_scandir(path: str, executor=None,
+                   on_batch: Optional[Callable[[int], None]] = None,
+                   batch_size: int = 256):
+    """Delete a directory tree with an iterative scandir walk.
+    
+    entry.is_dir(follow_symlinks=False) reuses the directory listing's
+    entry type, so no extra lstat is issued per child. Junctions are
+    removed as links and never descended into, as shutil.rmtree does.
+    Files are unlinked in batches; directories are removed bottom-up once
+    all their files are gone.
+    
+    Args:
+        path: Root directory to delete
+        executor: Optional executor used to unlink each batch of files
+        on_batch: Optional callback receiving the number of files deleted per batch
+        batch_size: Number of files unlinked per batch
+    
+    Raises:
+        FileNotFoundError: If path does not exist
+    """
+    unlink_all = executor.map if executor is not None else map
+    dirs = [path]
+    batch = []
+    stack = [path]
+    
+    def flush():
+        # Consume the iterator so unlink errors propagate to the caller
+        for _ in unlink_all(os.unlink, batch):
+            pass
+        if on_batch:
+            on_batch(len(batch))
+        batch.clear()
+    
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if is_reparse_point(entry):
+                        # Junction: remove the link itself, never its target
+                        os.rmdir(entry.path)
+                        continue
+                    dirs.append(entry.path)
+                    stack.append(entry.path)
+                else:
+                    batch.append(entry.path)
+                    if len(batch) >= batch_size:
+                        flush()
+    if batch:
+        flush()
+    
+    # Parents are always discovered before children, so reverse order is bottom-up
+    for directory in reversed(dirs):
+        os.rmdir(directory)
+
+
 # ============================================================================
 # JSON CONFIG LOADER
 # ============================================================================
@@ -164,6 +229,11 @@ USER_LIST_REFRESH_DELAY_MS = 200
 REFRESH_SCAN_DELAY_MS = 100
 SPLASH_DELAY_MS = 500
 SCAN_DELAY_MS = 500
+SCAN_DEBOUNCE_MS = 150
+SEARCH_DEBOUNCE_MS = 250
+LOG_FLUSH_DELAY_MS = 50
+SESSION_REFRESH_DELAY_MS = 100
+PROGRESS_UPDATE_MS = 50
 
 # Build info
 APP_NAME = 'SurfManager'
@@ -298,12 +368,15 @@ from_constants = [
     'USER_BUTTON_MIN_WIDTH', 'USER_BUTTON_MAX_HEIGHT',
     'GITHUB_BUTTON_WIDTH', 'GITHUB_BUTTON_HEIGHT',
     'USER_LIST_REFRESH_DELAY_MS', 'REFRESH_SCAN_DELAY_MS',
-    'SPLASH_DELAY_MS', 'SCAN_DELAY_MS'
+    'SPLASH_DELAY_MS', 'SCAN_DELAY_MS', 'SCAN_DEBOUNCE_MS',
+    'SEARCH_DEBOUNCE_MS', 'LOG_FLUSH_DELAY_MS', 'SESSION_REFRESH_DELAY_MS',
+    'PROGRESS_UPDATE_MS'
 ]
 
 from_utils = [
     'is_debug_mode', 'debug_print', 'get_resource_path',
-    'open_folder_in_explorer', 'ensure_directory'
+    'open_folder_in_explorer', 'ensure_directory',
+    'is_reparse_point', 'rmtree_scandir'
 ]
 
 from_messages = [
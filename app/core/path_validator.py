@@ -1,8 +1,42 @@
 """Path validation utilities for SurfManager."""
 import os
 import re
+import stat
+from functools import lru_cache
 from pathlib import Path
-from typing import Tuple, Optional
+from typing import FrozenSet, Tuple, Optional
+
+
+# Directories that must never be deleted (resolved lazily, see _dangerous_paths)
+_DANGEROUS_PATHS = (
+    Path.home(),
+    Path.home() / "Documents",
+    Path.home() / "Desktop",
+    Path.home() / "Downloads",
+    Path("C:\\Windows"),
+    Path("C:\\Program Files"),
+    Path("C:\\Program Files (x86)"),
+)
+_dangerous_resolved = None
+
+# Characters matched by DANGEROUS_PATTERNS - lets clean paths skip the regex scan
+_BAD_CHARS = frozenset('<>"|?*')
+
+
+def _dangerous_paths() -> Tuple[Tuple[Path, str, FrozenSet[str]], ...]:
+    """Get (display_path, resolved_string, ancestor_strings) entries for dangerous paths."""
+    global _dangerous_resolved
+    if _dangerous_resolved is None:
+        resolved = []
+        for dangerous in _DANGEROUS_PATHS:
+            try:
+                real = os.path.normcase(os.path.realpath(dangerous))
+                ancestors = frozenset(str(parent) for parent in Path(real).parents)
+                resolved.append((dangerous, real, ancestors))
+            except (OSError, RuntimeError):
+                pass  # Path resolution may fail for some directories
+        _dangerous_resolved = tuple(resolved)
+    return _dangerous_resolved
 
 
 class PathValidator:
@@ -33,51 +67,73 @@ class PathValidator:
         if not path or not isinstance(path, str):
             return False, "Path cannot be empty", None
         
-        # Remove extra whitespace
-        path = path.strip()
-        
-        # Check length
-        if len(path) > PathValidator.MAX_PATH_LENGTH:
-            return False, f"Path too long (max {PathValidator.MAX_PATH_LENGTH} characters)", None
+        # String checks are cached per input string; they never touch the disk
+        is_valid, error, stripped = PathValidator._validate_pure(path)
+        if not is_valid:
+            return False, error, None
         
-        # Check for dangerous patterns
-        for pattern in PathValidator.DANGEROUS_PATTERNS:
-            match = re.search(pattern, path, re.IGNORECASE)
-            if match:
-                # Show the actual problematic character/pattern, not the regex
-                if pattern == r'[<>"|?*]':
-                    return False, f"Path contains invalid characters: {match.group()}", None
-                elif pattern == r'\.\.[\\/]':
-                    return False, "Path contains parent directory traversal (..)", None
-                else:
-                    return False, f"Path contains invalid pattern: {match.group()}", None
-        
-        # Try to normalize path
+        # Normalize outside the cache: realpath follows links and the working directory
         try:
-            normalized = Path(path).resolve()
+            normalized = os.path.realpath(stripped)
         except Exception as e:
             return False, f"Invalid path format: {e}", None
         
-        # Check if path exists
-        if must_exist and not normalized.exists():
-            return False, "Path does not exist", None
-        
-        # Check if path is accessible
-        if normalized.exists():
+        # Single stat for existence, type and accessibility
+        try:
+            st = os.stat(normalized)
+        except (FileNotFoundError, NotADirectoryError):
+            st = None
+        except PermissionError:
+            return False, "Permission denied to access path", None
+        except Exception as e:
+            return False, f"Cannot access path: {e}", None
+        
+        if st is None:
+            if must_exist:
+                return False, "Path does not exist", None
+            if not allow_creation:
+                return False, "Path does not exist and creation not allowed", None
+        elif stat.S_ISDIR(st.st_mode):
+            # Try to access the directory
             try:
-                # Try to access the path
-                if normalized.is_dir():
-                    list(normalized.iterdir())
-                elif normalized.is_file():
-                    normalized.stat()
+                with os.scandir(normalized):
+                    pass
             except PermissionError:
                 return False, "Permission denied to access path", None
             except Exception as e:
                 return False, f"Cannot access path: {e}", None
-        elif not allow_creation:
-            return False, "Path does not exist and creation not allowed", None
         
-        return True, "", normalized
+        return True, "", Path(normalized)
+    
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _validate_pure(path: str) -> Tuple[bool, str, Optional[str]]:
+        """Run the I/O-free part of validate_path (whitespace, length, patterns).
+        
+        Returns:
+            Tuple of (is_valid, error_message, stripped_path)
+        """
+        # Remove extra whitespace
+        path = path.strip()
+    
+        # Check length
+        if len(path) > PathValidator.MAX_PATH_LENGTH:
+            return False, f"Path too long (max {PathValidator.MAX_PATH_LENGTH} characters)", None
+    
+        # Check for dangerous patterns (regex only runs when a cheap scan finds a suspect)
+        if '..' in path or not _BAD_CHARS.isdisjoint(path):
+            for pattern in PathValidator.DANGEROUS_PATTERNS:
+                match = re.search(pattern, path, re.IGNORECASE)
+                if match:
+                    # Show the actual problematic character/pattern, not the regex
+                    if pattern == r'[<>"|?*]':
+                        return False, f"Path contains invalid characters: {match.group()}", None
+                    elif pattern == r'\.\.[\\/]':
+                        return False, "Path contains parent directory traversal (..)", None
+                    else:
+                        return False, f"Path contains invalid pattern: {match.group()}", None
+    
+        return True, "", path
     
     @staticmethod
     def validate_backup_path(path: str) -> Tuple[bool, str]:
@@ -157,26 +213,13 @@ class PathValidator:
             Tuple of (is_safe, warning_message)
         """
         try:
-            normalized = Path(path).resolve()
+            normalized = os.path.normcase(os.path.realpath(path))
         except Exception as e:
             return False, f"Invalid path: {e}"
         
-        # Don't allow deleting system directories
-        dangerous_paths = [
-            Path.home(),
-            Path.home() / "Documents",
-            Path.home() / "Desktop",
-            Path.home() / "Downloads",
-            Path("C:\\Windows"),
-            Path("C:\\Program Files"),
-            Path("C:\\Program Files (x86)"),
-        ]
-        
-        for dangerous in dangerous_paths:
-            try:
-                if normalized == dangerous.resolve() or normalized in dangerous.resolve().parents:
-                    return False, f"Cannot delete system/important directory: {dangerous}"
-            except (OSError, RuntimeError):
-                pass  # Path resolution may fail for some directories
+        # Don't allow deleting system directories or any of their ancestors
+        for dangerous, resolved, ancestors in _dangerous_paths():
+            if normalized == resolved or normalized in ancestors:
+                return False, f"Cannot delete system/important directory: {dangerous}"
         
         return True, ""
@@ -1,13 +1,40 @@
 """Reset thread for application data cleaning - Simplified version."""
 import os
 import sys
-import time
 import json
-import shutil
+import threading
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from PyQt6.QtCore import QThread, pyqtSignal
-from typing import Optional, Dict
-from app.core.core_utils import get_resource_path
+from typing import Optional, Dict, Callable
+from app.core.core_utils import get_resource_path, is_reparse_point, rmtree_scandir
+
+
+# Deletion tuning - unlink is I/O bound, so threads overlap the syscalls
+DELETE_WORKERS = 8
+DELETE_BATCH_SIZE = 256
+
+
+def _count_files(path: str) -> int:
+    """Count files under path with a scandir walk.
+    
+    DirEntry.is_dir(follow_symlinks=False) uses the cached d_type, so no
+    extra stat is issued per entry.
+    """
+    total = 0
+    stack = [path]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if not is_reparse_point(entry):
+                            stack.append(entry.path)  # Junctions are unlinked, not walked
+                    else:
+                        total += 1
+        except OSError:
+            continue  # Unreadable folders surface later during deletion
+    return total
 
 
 class ResetThread(QThread):
@@ -17,6 +44,11 @@ class ResetThread(QThread):
     finished = pyqtSignal(bool, str)
     cancelled = pyqtSignal()
     
+    # Parsed reset.json shared across instances, invalidated by file mtime
+    _cached_config: Optional[Dict] = None
+    _cached_mtime: float = 0.0
+    _config_lock = threading.Lock()
+    
     def __init__(self, app_manager, app_name: str):
         super().__init__()
         self.app_manager = app_manager
@@ -33,21 +65,28 @@ class ResetThread(QThread):
         """Check if operation was cancelled."""
         return self._is_cancelled
     
-    def _load_reset_config(self) -> Dict:
-        """Load reset configuration from reset.json."""
+    @classmethod
+    def _load_reset_config(cls) -> Dict:
+        """Load reset configuration from reset.json (cached until the file changes)."""
         try:
             config_path = get_resource_path('app/config/reset.json')
-            
-            with open(config_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            mtime = os.stat(config_path).st_mtime
+            
+            with cls._config_lock:
+                if cls._cached_config is not None and mtime == cls._cached_mtime:
+                    return cls._cached_config
+                
+                with open(config_path, 'r', encoding='utf-8') as f:
+                    cls._cached_config = json.load(f)
+                cls._cached_mtime = mtime
+                return cls._cached_config
         except Exception as e:
             print(f"Warning: Could not load reset.json: {e}")
             return {}
     
     def _expand_path(self, path_template: str) -> str:
         """Expand environment variables in path template."""
-        expanded = os.path.expandvars(path_template)
-        return expanded.replace('/', os.sep)
+        return os.path.normpath(os.path.expandvars(path_template))
     
     def run(self):
         """Execute the reset operation - simplified version."""
@@ -96,13 +135,12 @@ class ResetThread(QThread):
             else:
                 self._emit_progress("Closing", f"Warning: {msg}", 15)
             
-            # Wait for processes to fully terminate
-            for i in range(30):
-                if self.is_cancelled():
-                    self.cancelled.emit()
-                    self.finished.emit(False, "Operation cancelled by user")
-                    return
-                time.sleep(0.1)
+            # Wait for processes to fully terminate (returns as soon as they exit)
+            self._emit_progress("Closing", "Waiting for processes to exit...", 20)
+            if not self.app_manager.wait_until_terminated(
+                self.app_name, timeout=3.0, poll=0.05, should_cancel=self.is_cancelled
+            ) and not self.is_cancelled():
+                self._emit_progress("Closing", "Warning: some processes are still running", 25)
             
             # Check cancellation before deletion
             if self.is_cancelled():
@@ -115,7 +153,17 @@ class ResetThread(QThread):
             
             if reset_path.exists():
                 try:
-                    shutil.rmtree(reset_path, ignore_errors=False)
+                    total_files = _count_files(str(reset_path))
+                    self.progress.emit(f"Found {total_files} files to delete")
+                    deleted = 0
+                    
+                    def on_batch(count: int):
+                        nonlocal deleted
+                        deleted += count
+                        self.progress_percent.emit(30 + 30 * min(deleted, total_files) // max(total_files, 1))
+                    
+                    with ThreadPoolExecutor(max_workers=DELETE_WORKERS) as executor:
+                        rmtree_scandir(str(reset_path), executor, on_batch, DELETE_BATCH_SIZE)
                     self._emit_progress("Deleting", "Folder deleted successfully", 60)
                 except Exception as e:
                     self._emit_progress("Deleting", f"Error deleting folder: {e}", 60)
@@ -1,10 +1,26 @@
 """Undo/Redo functionality for destructive operations."""
+import os
 import json
+import stat
 import shutil
 from pathlib import Path
 from datetime import datetime
 from typing import List, Dict, Optional, Callable
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
+
+
+# Actions that remove the original path outright; only these may share inodes
+# with their backup since the original is never modified in place afterwards.
+HARDLINK_ACTION_TYPES = ('delete', 'reset')
+
+
+def _link_or_copy(src: str, dst: str) -> str:
+    """Hardlink src to dst, falling back to a full copy if linking fails."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+    return dst
 
 
 @dataclass
@@ -20,12 +36,29 @@ class UndoAction:
     
     def to_dict(self) -> Dict:
         """Convert to dictionary."""
-        return asdict(self)
+        # Fields are flat, so build the dict directly instead of asdict()'s deep copy
+        return {
+            'action_type': self.action_type,
+            'timestamp': self.timestamp,
+            'app_name': self.app_name,
+            'backup_path': self.backup_path,
+            'original_path': self.original_path,
+            'description': self.description,
+            'metadata': self.metadata or {}
+        }
     
     @staticmethod
     def from_dict(data: Dict) -> 'UndoAction':
         """Create from dictionary."""
-        return UndoAction(**data)
+        return UndoAction(
+            data['action_type'],
+            data['timestamp'],
+            data['app_name'],
+            data['backup_path'],
+            data['original_path'],
+            data['description'],
+            data.get('metadata')
+        )
 
 
 class UndoManager:
@@ -94,13 +127,19 @@ class UndoManager:
             backup_name = f"{app_name}_{action_type}_{timestamp}"
             backup_path = self.undo_dir / backup_name
             
-            # Copy data to backup
+            # Copy data to backup (hardlink when on the same volume)
             original = Path(original_path)
             if original.exists():
+                if action_type in HARDLINK_ACTION_TYPES and self._is_same_volume(original):
+                    copy_function = _link_or_copy
+                else:
+                    copy_function = shutil.copy2
+                
                 if original.is_dir():
-                    shutil.copytree(original, backup_path, dirs_exist_ok=True)
+                    shutil.copytree(original, backup_path, copy_function=copy_function,
+                                    dirs_exist_ok=True)
                 else:
-                    shutil.copy2(original, backup_path)
+                    copy_function(str(original), str(backup_path))
                 
                 # Create undo action
                 action = UndoAction(
@@ -122,6 +161,20 @@ class UndoManager:
             print(f"Error creating backup: {e}")
             return None
     
+    def _is_same_volume(self, path: Path) -> bool:
+        """Check if path lives on the same volume as the undo directory.
+        
+        Args:
+            path: Path to compare against the undo directory
+            
+        Returns:
+            True if both paths share a device, False otherwise
+        """
+        try:
+            return os.stat(path).st_dev == os.stat(self.undo_dir).st_dev
+        except OSError:
+            return False
+    
     def push_action(self, action: UndoAction):
         """Push action to undo stack.
         
@@ -279,17 +332,30 @@ class UndoManager:
         except Exception as e:
             print(f"Warning: Failed to cleanup backup {backup_path}: {e}")
     
+    @staticmethod
+    def _dir_size(path: str) -> int:
+        """Sum file sizes under path with an iterative scandir walk."""
+        total = 0
+        stack = [path]
+        while stack:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        total += entry.stat(follow_symlinks=False).st_size
+        return total
+    
     def get_history_size(self) -> int:
         """Get total size of undo history in bytes."""
         total_size = 0
         for action in self.undo_stack + self.redo_stack:
             try:
-                path = Path(action.backup_path)
-                if path.exists():
-                    if path.is_dir():
-                        total_size += sum(f.stat().st_size for f in path.rglob('*') if f.is_file())
-                    else:
-                        total_size += path.stat().st_size
+                st = os.stat(action.backup_path)
+                if stat.S_ISDIR(st.st_mode):
+                    total_size += self._dir_size(action.backup_path)
+                else:
+                    total_size += st.st_size
             except Exception:
                 pass
         return total_size
@@ -1,10 +1,15 @@
 """Windows Multi-user Manager for SurfManager."""
 import os
+import re
+import time
 import subprocess
 import getpass
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
+from functools import lru_cache
 
 try:
     import winreg
@@ -12,6 +17,12 @@ except ImportError:
     # Fallback for non-Windows systems
     winreg = None
 
+try:
+    import ctypes
+    from ctypes import wintypes
+except (ImportError, ValueError):
+    ctypes = None
+
 try:
     from app.core.core_utils import debug_print
 except ImportError:
@@ -19,6 +30,161 @@ except ImportError:
         print(f"[DEBUG] {msg}")
 
 
+if ctypes is not None:
+    class _USER_INFO_2(ctypes.Structure):
+        """Leading fields of the Win32 USER_INFO_2 struct, up to the full name."""
+        _fields_ = [
+            ('usri2_name', wintypes.LPWSTR),
+            ('usri2_password', wintypes.LPWSTR),
+            ('usri2_password_age', wintypes.DWORD),
+            ('usri2_priv', wintypes.DWORD),
+            ('usri2_home_dir', wintypes.LPWSTR),
+            ('usri2_comment', wintypes.LPWSTR),
+            ('usri2_flags', wintypes.DWORD),
+            ('usri2_script_path', wintypes.LPWSTR),
+            ('usri2_auth_flags', wintypes.DWORD),
+            ('usri2_full_name', wintypes.LPWSTR),
+        ]
+
+# Built-in account RIDs that never own an interactive profile
+# (Guest, DefaultAccount, WDAGUtilityAccount)
+_SERVICE_ACCOUNT_RIDS = frozenset({'501', '503', '504'})
+
+
+def _is_user_sid(sid: str) -> bool:
+    """Check from the SID string alone whether a ProfileList entry can be a user profile."""
+    if sid.startswith('S-1-5-'):
+        # Only domain/local account SIDs (S-1-5-21-...) are users; S-1-5-18/19/20 are services
+        if not sid.startswith('S-1-5-21-'):
+            return False
+        return sid.rsplit('-', 1)[1] not in _SERVICE_ACCOUNT_RIDS
+    return True
+
+
+def _parse_session_usernames(output: str) -> List[str]:
+    """Extract usernames from 'query user' output using the header's column offsets.
+    
+    The output is fixed-width; slicing the first column keeps usernames with
+    spaces intact and drops the '>' marker of the current session.
+    
+    Args:
+        output: stdout of 'query user'
+        
+    Returns:
+        List of usernames
+    """
+    lines = output.splitlines()
+    if not lines:
+        return []
+    
+    # Username column runs from the first header to the start of the second
+    header = lines[0]
+    columns = [m.start() for m in re.finditer(r'\S+', header)]
+    if len(columns) < 2:
+        return [line.split()[0].lstrip('>') for line in lines[1:] if line.strip()]
+    start, end = columns[0], columns[1]
+    
+    usernames = []
+    for line in lines[1:]:
+        username = line[start:end].strip().lstrip('>')
+        if username:
+            usernames.append(username)
+    return usernames
+
+
+def _lru_get(cache: OrderedDict, key):
+    """Get a cached value and mark it most recently used."""
+    value = cache.get(key)
+    if value is not None:
+        cache.move_to_end(key)
+    return value
+
+
+def _lru_put(cache: OrderedDict, key, value):
+    """Store a value, evicting the least recently used entry past PATH_CACHE_MAX_ENTRIES."""
+    cache[key] = value
+    if len(cache) > PATH_CACHE_MAX_ENTRIES:
+        cache.popitem(last=False)
+
+
+@lru_cache(maxsize=256)
+def _compile_path_template(template: str) -> Tuple[str, str, str]:
+    """Split an app path template into its AppData root and the remainder.
+    
+    Templates are fixed per app config, so this runs once per template
+    instead of two str.replace scans per user.
+    
+    Args:
+        template: Path template such as '%APPDATA%/Cursor'
+        
+    Returns:
+        Tuple of (root_kind, suffix, lowercase_first_segment); root_kind is
+        'roaming', 'local' or 'literal' (no leading AppData variable)
+    """
+    for variable, kind in (('%APPDATA%', 'roaming'), ('%LOCALAPPDATA%', 'local')):
+        if template.startswith(variable):
+            suffix = template[len(variable):].lstrip('\\/')
+            first_segment = suffix.replace('\\', '/').split('/', 1)[0].lower()
+            return kind, suffix, first_segment
+    return 'literal', template, ''
+
+
+# netapi32.dll handle, loaded once on first use
+_netapi32 = None
+
+
+def _get_netapi32():
+    """Load netapi32.dll and declare the functions used from it."""
+    global _netapi32
+    if _netapi32 is None:
+        netapi32 = ctypes.WinDLL('netapi32')
+        netapi32.NetUserGetInfo.argtypes = [
+            wintypes.LPCWSTR, wintypes.LPCWSTR, wintypes.DWORD,
+            ctypes.POINTER(ctypes.c_void_p)
+        ]
+        netapi32.NetUserGetInfo.restype = wintypes.DWORD
+        netapi32.NetApiBufferFree.argtypes = [ctypes.c_void_p]
+        netapi32.NetApiBufferFree.restype = wintypes.DWORD
+        _netapi32 = netapi32
+    return _netapi32
+
+
+def _get_full_name(username: str) -> Optional[str]:
+    """Get a local account's full name via NetUserGetInfo (no subprocess).
+    
+    Args:
+        username: Account name to look up
+        
+    Returns:
+        Full name, or None if unavailable
+    """
+    if ctypes is None or os.name != 'nt':
+        return None
+    
+    try:
+        netapi32 = _get_netapi32()
+        buffer = ctypes.c_void_p()
+        if netapi32.NetUserGetInfo(None, username, 2, ctypes.byref(buffer)) != 0:
+            return None
+        try:
+            info = ctypes.cast(buffer, ctypes.POINTER(_USER_INFO_2)).contents
+            return info.usri2_full_name or None
+        finally:
+            netapi32.NetApiBufferFree(buffer)
+    except (OSError, AttributeError):
+        return None
+
+
+# Seconds a detected user list stays valid before the system is queried again
+USERS_CACHE_TTL = 30.0
+
+# Max entries kept in each per-user path cache (resolved paths, AppData listings)
+PATH_CACHE_MAX_ENTRIES = 64
+
+# Seconds the 'query user' session list is reused; logons/logoffs are rare
+ACTIVE_USERS_CACHE_TTL = 30.0
+
+
 @dataclass
 class WindowsUser:
     """Represents a Windows user account."""
@@ -36,31 +202,77 @@ class UserManager:
     
     def __init__(self):
         self.current_user = getpass.getuser()
+        self._current_user_lower = self.current_user.lower()
         self._users_cache = None
+        self._users_cache_ts = 0.0
+        self._users_by_name: Dict[str, WindowsUser] = {}
+        self._resolved_paths: "OrderedDict[str, Tuple[str, str, str]]" = OrderedDict()
+        self._dir_entries_cache: "OrderedDict[str, frozenset]" = OrderedDict()
+        self._active_users_cache: Optional[List[str]] = None
+        self._profile_paths: Dict[str, str] = {}
+        self._profile_list_stamp = None
+        self._active_users_ts = 0.0
         self._selected_user = self.current_user
+        
+        # Detection runs on worker threads while the GUI thread reads the caches:
+        # _lock is held only briefly around cache reads and writes, while
+        # _detect_lock serializes the slow registry/'query user' detection
+        self._lock = threading.Lock()
+        self._detect_lock = threading.Lock()
+    
+    def _users_stale(self) -> bool:
+        """Check whether the cached user list needs rebuilding."""
+        return (self._users_cache is None
+                or time.monotonic() - self._users_cache_ts > USERS_CACHE_TTL)
     
     def get_windows_users(self, refresh_cache: bool = False) -> List[WindowsUser]:
-        """Get all Windows user accounts."""
-        if self._users_cache is None or refresh_cache:
-            self._users_cache = self._detect_users()
+        """Get all Windows user accounts (cached for USERS_CACHE_TTL seconds).
+        
+        A rebuild can block for seconds, so call this off the GUI thread.
+        """
+        if refresh_cache or self._users_stale():
+            with self._detect_lock:
+                # Another thread may have rebuilt the list while this one waited
+                if refresh_cache or self._users_stale():
+                    users = self._detect_users()
+                    with self._lock:
+                        self._users_cache = users
+                        self._users_by_name = {u.username.lower(): u for u in users}
+                        self._resolved_paths.clear()
+                        # New installs show up as new AppData folders
+                        self._dir_entries_cache.clear()
+                        self._users_cache_ts = time.monotonic()
         return self._users_cache
     
+    def _find_user(self, username: str) -> Optional[WindowsUser]:
+        """Look up a user by name (case-insensitive) via the cached index."""
+        self.get_windows_users()
+        return self._users_by_name.get(username.lower())
+    
     def _detect_users(self) -> List[WindowsUser]:
         """Detect Windows user accounts from registry and active sessions."""
         users = []
-        current_user = self.current_user.lower()
+        current_user = self._current_user_lower
         
         try:
+            # Start 'query user' first so it runs while the registry is read
+            session_query = None
+            if self._active_users_stale():
+                try:
+                    session_query = self._start_session_query()
+                except OSError as e:
+                    debug_print(f"Error getting active users: {e}")
+            
             # Get users from registry
             registry_users = self._get_registry_users()
             
-            # Get active/logged in users
-            active_users = self._get_active_users()
+            # Get active/logged in users, keyed once for O(1) joins below
+            active_users = {u.lower() for u in self._get_active_users(session_query)}
             
             # Combine information
             for reg_user in registry_users:
                 username = reg_user['username'].lower()
-                is_active = username in [u.lower() for u in active_users]
+                is_active = username in active_users
                 is_current = username == current_user
                 
                 user = WindowsUser(
@@ -100,100 +312,120 @@ class UserManager:
             return users
         
         try:
-            # Open ProfileList registry key
-            profiles_key = winreg.OpenKey(
+            access = winreg.KEY_READ | winreg.KEY_WOW64_64KEY
+            
+            # Open ProfileList registry key (handles close on exit, even on errors)
+            with winreg.OpenKey(
                 winreg.HKEY_LOCAL_MACHINE,
-                r"SOFTWARE\Microsoft\Windows NT\CurrentVersion\ProfileList"
-            )
+                r"SOFTWARE\Microsoft\Windows NT\CurrentVersion\ProfileList",
+                0, access
+            ) as profiles_key:
+                # ProfileList's last-write time changes when profiles are added/removed
+                subkey_count, _, last_write = winreg.QueryInfoKey(profiles_key)
+                if last_write != self._profile_list_stamp:
+                    self._profile_paths = self._read_profile_paths(profiles_key, subkey_count, access)
+                    self._profile_list_stamp = last_write
             
-            i = 0
-            while True:
-                try:
-                    # Enumerate subkeys (SIDs)
-                    sid = winreg.EnumKey(profiles_key, i)
-                    
-                    # Skip system accounts (S-1-5-18, S-1-5-19, S-1-5-20)
-                    if sid.startswith('S-1-5-') and not sid.startswith('S-1-5-21-'):
-                        i += 1
-                        continue
-                    
-                    # Open user profile key
-                    user_key = winreg.OpenKey(profiles_key, sid)
-                    
-                    try:
-                        # Get profile path
-                        profile_path = winreg.QueryValueEx(user_key, "ProfileImagePath")[0]
-                        
-                        # Extract username from profile path
-                        username = os.path.basename(profile_path)
-                        
-                        # Skip system accounts
-                        if username.lower() in ['systemprofile', 'localservice', 'networkservice']:
-                            i += 1
-                            continue
-                        
-                        # Try to get display name
-                        display_name = username
-                        try:
-                            # Try to get full name from user account
-                            result = subprocess.run([
-                                'net', 'user', username
-                            ], capture_output=True, text=True, timeout=5)
-                            
-                            if result.returncode == 0:
-                                for line in result.stdout.split('\n'):
-                                    if 'Full Name' in line:
-                                        full_name = line.split('Full Name')[1].strip()
-                                        if full_name and full_name != username:
-                                            display_name = full_name
-                                        break
-                        except (OSError, PermissionError):
-                            pass  # Cannot access registry for this user
-                        
-                        users.append({
-                            'username': username,
-                            'display_name': display_name,
-                            'profile_path': profile_path,
-                            'sid': sid
-                        })
-                        
-                    except FileNotFoundError:
-                        pass
-                    finally:
-                        winreg.CloseKey(user_key)
-                    
-                    i += 1
-                    
-                except OSError:
-                    break
-                    
-            winreg.CloseKey(profiles_key)
+            for sid, profile_path in self._profile_paths.items():
+                # Extract username from profile path
+                username = os.path.basename(profile_path)
+                
+                # Skip system accounts
+                if username.lower() in ['systemprofile', 'localservice', 'networkservice']:
+                    continue
+                
+                # Try to get display name
+                display_name = username
+                full_name = _get_full_name(username)
+                if full_name and full_name != username:
+                    display_name = full_name
+                
+                users.append({
+                    'username': username,
+                    'display_name': display_name,
+                    'profile_path': profile_path,
+                    'sid': sid
+                })
             
         except Exception as e:
             debug_print(f"Error reading registry users: {e}")
         
         return users
     
-    def _get_active_users(self) -> List[str]:
-        """Get currently active/logged in users."""
+    @staticmethod
+    def _read_profile_paths(profiles_key, subkey_count: int, access: int) -> Dict[str, str]:
+        """Read ProfileImagePath for every user SID under ProfileList in one pass.
+        
+        Args:
+            profiles_key: Open ProfileList key
+            subkey_count: Number of subkeys reported by QueryInfoKey
+            access: Access mask for opening the SID subkeys
+            
+        Returns:
+            Dict mapping SID to profile path
+        """
+        profile_paths = {}
+        for i in range(subkey_count):
+            # Enumerate subkeys (SIDs)
+            sid = winreg.EnumKey(profiles_key, i)
+            
+            # Filter on the SID before paying for OpenKey/QueryValueEx
+            if not _is_user_sid(sid):
+                continue
+            
+            # Get profile path from the user profile key
+            try:
+                with winreg.OpenKey(profiles_key, sid, 0, access) as user_key:
+                    profile_paths[sid] = winreg.QueryValueEx(user_key, "ProfileImagePath")[0]
+            except OSError:
+                continue
+        return profile_paths
+    
+    def _active_users_stale(self) -> bool:
+        """Check whether the cached session list needs re-querying."""
+        return (self._active_users_cache is None
+                or time.monotonic() - self._active_users_ts > ACTIVE_USERS_CACHE_TTL)
+    
+    def _get_active_users(self, session_query: Optional[subprocess.Popen] = None) -> List[str]:
+        """Get currently active/logged in users (cached for ACTIVE_USERS_CACHE_TTL seconds).
+        
+        Args:
+            session_query: Already started 'query user' process to collect, if any
+        """
+        if session_query is not None or self._active_users_stale():
+            self._active_users_cache = self._query_active_users(session_query)
+            self._active_users_ts = time.monotonic()
+        return self._active_users_cache
+    
+    @staticmethod
+    def _start_session_query() -> subprocess.Popen:
+        """Start 'query user' without waiting for it."""
+        return subprocess.Popen(
+            ['query', 'user'],
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
+        )
+    
+    def _query_active_users(self, session_query: Optional[subprocess.Popen] = None) -> List[str]:
+        """Query active sessions from the system.
+        
+        Args:
+            session_query: Already started 'query user' process to collect, if any
+        """
         active_users = []
         
         try:
             # Use 'query user' command to get active sessions
-            result = subprocess.run([
-                'query', 'user'
-            ], capture_output=True, text=True, timeout=10)
+            if session_query is None:
+                session_query = self._start_session_query()
+            try:
+                stdout, _ = session_query.communicate(timeout=10)
+            except subprocess.TimeoutExpired:
+                session_query.kill()
+                session_query.communicate()
+                raise
             
-            if result.returncode == 0:
-                lines = result.stdout.strip().split('\n')[1:]  # Skip header
-                for line in lines:
-                    if line.strip():
-                        # Parse query user output
-                        parts = line.split()
-                        if len(parts) >= 1:
-                            username = parts[0].strip()
-                            if username and username != 'USERNAME':
-                                active_users.append(username)
+            if session_query.returncode == 0:
+                active_users = _parse_session_usernames(stdout)
         except Exception as e:
             debug_print(f"Error getting active users: {e}")
         
@@ -208,11 +440,14 @@ class UserManager:
         return self._selected_user
     
     def set_selected_user(self, username: str) -> bool:
-        """Set the selected user for operations."""
-        users = self.get_windows_users()
-        user_names = [u.username.lower() for u in users]
+        """Set the selected user for operations.
         
-        if username.lower() in user_names:
+        Checks the already detected users only, so it never blocks on detection;
+        returns False until a user list has been published.
+        """
+        with self._lock:
+            known = username.lower() in self._users_by_name
+        if known:
             self._selected_user = username
             debug_print(f"Selected user changed to: {username}")
             return True
@@ -224,26 +459,49 @@ class UserManager:
         if username is None:
             username = self._selected_user
         
-        users = self.get_windows_users()
-        for user in users:
-            if user.username.lower() == username.lower():
-                return user.profile_path
+        user = self._find_user(username)
+        if user is not None:
+            return user.profile_path
         
         # Fallback to standard Windows path
         return f"C:\\Users\\{username}"
     
+    def resolve(self, username: Optional[str] = None) -> Tuple[str, str, str]:
+        """Get profile and AppData paths for specified user (or selected user).
+        
+        Args:
+            username: User to resolve, defaults to the selected user
+            
+        Returns:
+            Tuple of (profile_path, appdata_roaming, appdata_local)
+        """
+        if username is None:
+            username = self._selected_user
+        
+        # Refresh first so a rebuilt index also resets the resolved paths
+        self.get_windows_users()
+        key = username.lower()
+        with self._lock:
+            paths = _lru_get(self._resolved_paths, key)
+        if paths is None:
+            profile_path = self.get_user_profile_path(username)
+            paths = (
+                profile_path,
+                os.path.join(profile_path, "AppData", "Roaming"),
+                os.path.join(profile_path, "AppData", "Local")
+            )
+            with self._lock:
+                _lru_put(self._resolved_paths, key, paths)
+        return paths
+    
     def get_user_app_data_path(self, username: Optional[str] = None, local: bool = False) -> str:
         """Get AppData path for specified user."""
-        profile_path = self.get_user_profile_path(username)
-        
-        if local:
-            return os.path.join(profile_path, "AppData", "Local")
-        else:
-            return os.path.join(profile_path, "AppData", "Roaming")
+        _, appdata_roaming, appdata_local = self.resolve(username)
+        return appdata_local if local else appdata_roaming
     
     def can_access_user_profile(self, username: str) -> bool:
         """Check if we can access another user's profile."""
-        if username.lower() == self.current_user.lower():
+        if username.lower() == self._current_user_lower:
             return True
         
         try:
@@ -252,12 +510,39 @@ class UserManager:
         except (OSError, PermissionError):
             return False  # Cannot check user profile accessibility
     
+    def _dir_entries(self, path: str) -> frozenset:
+        """Get lowercase names in a directory, listed once per refresh."""
+        with self._lock:
+            entries = _lru_get(self._dir_entries_cache, path)
+        if entries is None:
+            try:
+                with os.scandir(path) as it:
+                    entries = frozenset(entry.name.lower() for entry in it)
+            except OSError:
+                entries = frozenset()
+            with self._lock:
+                _lru_put(self._dir_entries_cache, path, entries)
+        return entries
+    
+    def _candidate_path(self, template: str, appdata_roaming: str, appdata_local: str) -> Optional[str]:
+        """Expand a path template for a user, skipping paths that cannot exist.
+        
+        Returns:
+            Expanded path, or None if its first folder under AppData is absent
+        """
+        kind, suffix, first_segment = _compile_path_template(template)
+        if kind == 'literal':
+            return template.replace('%APPDATA%', appdata_roaming).replace('%LOCALAPPDATA%', appdata_local)
+        
+        root = appdata_roaming if kind == 'roaming' else appdata_local
+        if first_segment and first_segment not in self._dir_entries(root):
+            return None
+        return os.path.join(root, suffix) if suffix else root
+    
     def get_user_applications_data(self, username: str, app_configs: Dict) -> Dict:
         """Get application data paths for a specific user."""
         user_apps = {}
-        profile_path = self.get_user_profile_path(username)
-        appdata_roaming = os.path.join(profile_path, "AppData", "Roaming")
-        appdata_local = os.path.join(profile_path, "AppData", "Local")
+        _, appdata_roaming, appdata_local = self.resolve(username)
         
         for app_name, app_config in app_configs.items():
             user_app = {
@@ -269,22 +554,20 @@ class UserManager:
             
             # Check data paths
             for data_path_template in app_config.get('data_paths', []):
-                # Replace environment variables with user-specific paths
-                data_path = data_path_template.replace('%APPDATA%', appdata_roaming)
-                data_path = data_path.replace('%LOCALAPPDATA%', appdata_local)
+                # Expand with user-specific paths
+                data_path = self._candidate_path(data_path_template, appdata_roaming, appdata_local)
                 
-                if os.path.exists(data_path):
+                if data_path and os.path.exists(data_path):
                     user_app['installed'] = True
                     user_app['path'] = data_path
                     break
             
             # Check executable paths
             for exe_path_template in app_config.get('exe_paths', []):
-                # Replace environment variables
-                exe_path = exe_path_template.replace('%APPDATA%', appdata_roaming)
-                exe_path = exe_path.replace('%LOCALAPPDATA%', appdata_local)
+                # Expand with user-specific paths
+                exe_path = self._candidate_path(exe_path_template, appdata_roaming, appdata_local)
                 
-                if os.path.exists(exe_path):
+                if exe_path and os.path.exists(exe_path):
                     user_app['exe_path'] = exe_path
                     break
             
@@ -292,15 +575,15 @@ class UserManager:
         
         return user_apps
     
+    def invalidate_sessions(self):
+        """Drop the cached session list, e.g. after a logon/logoff."""
+        self._active_users_cache = None
+    
     def refresh_users(self):
         """Refresh the users cache."""
-        self._users_cache = None
+        self._profile_list_stamp = None
         return self.get_windows_users(refresh_cache=True)
     
     def get_user_info(self, username: str) -> Optional[WindowsUser]:
         """Get detailed information for a specific user."""
-        users = self.get_windows_users()
-        for user in users:
-            if user.username.lower() == username.lower():
-                return user
-        return None
+        return self._find_user(username)
@@ -1,48 +1,129 @@
 """Main window GUI for SurfManager - Optimized version."""
 import os
 import webbrowser
+from functools import cached_property, lru_cache
+from itertools import compress
+from operator import itemgetter
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QTabWidget, 
-    QStatusBar, QPushButton, QMessageBox, QLabel, QMenu
+    QStatusBar, QPushButton, QMessageBox, QLabel, QMenu, QApplication, QAbstractButton
 )
-from PyQt6.QtCore import Qt, QTimer, QThread, pyqtSignal, QMutex, QMutexLocker
+from PyQt6.QtCore import Qt, QTimer, QObject, QRunnable, QThreadPool, pyqtSignal, pyqtSlot
 from PyQt6.QtGui import QIcon, QShortcut, QKeySequence
-import threading
-from app.core.audio_manager import AudioManager
 from app.core.core_utils import (
-    debug_print,
+    debug_print, is_debug_mode,
     WINDOW_MIN_WIDTH, WINDOW_MIN_HEIGHT, WINDOW_DEFAULT_WIDTH, WINDOW_DEFAULT_HEIGHT,
     USER_BUTTON_MIN_WIDTH, USER_BUTTON_MAX_HEIGHT,
     GITHUB_BUTTON_WIDTH, GITHUB_BUTTON_HEIGHT,
-    USER_LIST_REFRESH_DELAY_MS, REFRESH_SCAN_DELAY_MS,
-    SPLASH_DELAY_MS, SCAN_DELAY_MS,
+    SCAN_DEBOUNCE_MS,
     get_constants
 )
-from app.gui.splash_screen import SplashScreen
-from app.gui.window_reset import ResetTab
-from app.gui.window_account import AccountTab
-from app.gui.window_advanced import AdvancedTab
-from app.gui.theme import COMPACT_DARK_STYLE
+from app.gui.theme import COMPACT_DARK_STYLE, apply_dark_theme
+from app.gui.ui_helpers import DialogHelper
 from app import __version__
 
+# Resolved once so release builds skip formatting debug messages
+DEBUG = is_debug_mode()
 
-class ScanThread(QThread):
-    """Background thread for scanning applications."""
-    finished = pyqtSignal(dict)
+_ICON_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'icons', 'surfmanager.ico')
+_HAS_ICON = os.path.exists(_ICON_PATH)
+
+
+@lru_cache(maxsize=1)
+def _window_icon():
+    """Shared window icon, built on first use (QIcon needs a QApplication).
+    
+    Returns:
+        QIcon for the window, or None if the icon file is missing
+    """
+    return QIcon(_ICON_PATH) if _HAS_ICON else None
+
+
+_get_installed = itemgetter('installed')
+
+# (key sequence, MainWindow slot name) pairs bound by setup_shortcuts
+_SHORTCUTS = (
+    ("Ctrl+R", "scan_applications"),
+    ("F5", "scan_applications"),
+    ("Ctrl+Q", "close"),
+)
+
+
+class _ScanSignals(QObject):
+    """Signals emitted by ScanRunnable (QRunnable cannot define signals itself)."""
+    finished = pyqtSignal(object)
     progress = pyqtSignal(str)
+    error = pyqtSignal(str)
+
+
+class ScanRunnable(QRunnable):
+    """Pooled background task for scanning applications."""
     
-    def __init__(self, app_manager, force_rescan=False):
+    def __init__(self, app_manager, force_rescan=False, user_manager=None, username=None):
         super().__init__()
         self.app_manager = app_manager
         self.force_rescan = force_rescan
+        self.user_manager = user_manager
+        self.username = username
+        self.signals = _ScanSignals()
     
     def run(self):
+        if self.username:
+            # Resolving may re-detect users (registry + 'query user'), so it
+            # runs here rather than on the GUI thread
+            try:
+                _, appdata_roaming, appdata_local = self.user_manager.resolve(self.username)
+            except Exception as e:
+                self.signals.error.emit(str(e))
+                return
+            self.app_manager.set_current_user(self.username, appdata_roaming, appdata_local)
+        
         if self.force_rescan:
-            self.progress.emit("Scanning for installed applications...")
+            self.signals.progress.emit("Scanning for installed applications...")
         else:
-            self.progress.emit("Checking application status...")
-        apps = self.app_manager.scan_applications(force_rescan=self.force_rescan)
-        self.finished.emit(apps)
+            self.signals.progress.emit("Checking application status...")
+        try:
+            apps = self.app_manager.scan_applications(force_rescan=self.force_rescan)
+        except Exception as e:
+            self.signals.error.emit(str(e))
+            return
+        
+        # Summarize on the worker so the GUI thread doesn't re-scan the dict
+        # AppManager always sets 'installed', so itemgetter/compress keep this in C
+        installed = tuple(compress(apps, map(_get_installed, apps.values())))
+        fingerprint = tuple(sorted(
+            (name, info.get('installed', False), info.get('running', False), info.get('path'))
+            for name, info in apps.items()
+        ))
+        self.signals.finished.emit({
+            'apps': apps,
+            'installed': installed,
+            'count': len(installed),
+            'fingerprint': fingerprint
+        })
+
+
+class _UserListSignals(QObject):
+    """Signals emitted by UserListRunnable."""
+    finished = pyqtSignal(list)
+    error = pyqtSignal(str)
+
+
+class UserListRunnable(QRunnable):
+    """Pooled background task for detecting Windows users."""
+    
+    def __init__(self, user_manager):
+        super().__init__()
+        self.user_manager = user_manager
+        self.signals = _UserListSignals()
+    
+    def run(self):
+        try:
+            users = self.user_manager.get_windows_users()
+        except Exception as e:
+            self.signals.error.emit(str(e))
+            return
+        self.signals.finished.emit(users)
 
 
 class MainWindow(QMainWindow):
@@ -52,33 +133,78 @@ class MainWindow(QMainWindow):
                  id_manager=None, config_manager=None):
         super().__init__()
         
-        # Core managers (use provided or create new instances)
-        from app.core.app_manager import AppManager
-        from app.core.backup_manager import BackupManager
-        from app.core.id_manager import IdManager
-        from app.core.config_manager import ConfigManager
+        # Core managers (use provided or create new instances). The app and
+        # config managers are needed by init_ui; backup and ID managers are
+        # only built on first access (see the cached properties below)
+        if app_manager is None:
+            from app.core.app_manager import AppManager
+            app_manager = AppManager()
+        if config_manager is None:
+            from app.core.config_manager import ConfigManager
+            config_manager = ConfigManager()
+        from app.core.user_manager import UserManager
         
-        self.app_manager = app_manager or AppManager()
-        self.backup_manager = backup_manager or BackupManager()
-        self.id_manager = id_manager or IdManager()
-        self.config_manager = config_manager or ConfigManager()
+        self.app_manager = app_manager
+        self.config_manager = config_manager
+        self._backup_manager_arg = backup_manager
+        self._id_manager_arg = id_manager
+        self.user_manager = UserManager()
         
         # UI managers
+        from app.core.audio_manager import AudioManager
         self.audio_manager = AudioManager()
-        self.scan_thread = None
-        self.test_mode = False
+        self._test_mode = False
         self.detected_apps = {}
-        
-        # Thread safety
-        self.scan_mutex = QMutex()
-        self.detected_apps_lock = threading.Lock()
-        
-        self.init_ui()
+        self._close_box = None
+        self._close_confirmed = False
+        self._log_append = None  # bound to the Reset tab's log widget in init_ui
+        self._last_apps_fingerprint = None
+        
+        # Scans run on the shared thread pool; this flag keeps them serialized
+        self._scan_in_flight = False
+        
+        # Coalesce bursts of scan requests (F5, user switch, reset callbacks)
+        self._pending_force_rescan = False
+        self._pending_log_details = False
+        self._scan_debounce = QTimer(self)
+        self._scan_debounce.setSingleShot(True)
+        self._scan_debounce.setInterval(SCAN_DEBOUNCE_MS)
+        self._scan_debounce.timeout.connect(self._do_scan)
+        
+        # Style the application before widgets exist so they are polished once
         self.apply_styles()
+        self.init_ui()
         self.setup_shortcuts()
 
-        # Trigger initial application scan after UI is ready
-        QTimer.singleShot(SPLASH_DELAY_MS, lambda: self.scan_applications(force_rescan=True))
+        # User detection and the initial scan are independent; start both now
+        self.refresh_user_list()
+        self.scan_applications(force_rescan=True)
+    
+    @cached_property
+    def backup_manager(self):
+        """Backup manager, constructed on first access unless one was passed in."""
+        if self._backup_manager_arg is not None:
+            return self._backup_manager_arg
+        from app.core.backup_manager import BackupManager
+        return BackupManager()
+    
+    @cached_property
+    def id_manager(self):
+        """ID manager, constructed on first access unless one was passed in."""
+        if self._id_manager_arg is not None:
+            return self._id_manager_arg
+        from app.core.id_manager import IdManager
+        return IdManager()
+    
+    @property
+    def test_mode(self) -> bool:
+        """Whether the window runs in test mode (no confirmations or dialogs)."""
+        return self._test_mode
+    
+    @test_mode.setter
+    def test_mode(self, enabled: bool):
+        self._test_mode = enabled
+        DialogHelper.headless = enabled
     
     def init_ui(self):
         """Initialize the main window UI."""
@@ -87,9 +213,9 @@ class MainWindow(QMainWindow):
         self.resize(WINDOW_DEFAULT_WIDTH, WINDOW_DEFAULT_HEIGHT)
         
         # Set window icon if exists
-        icon_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'icons', 'surfmanager.ico')
-        if os.path.exists(icon_path):
-            self.setWindowIcon(QIcon(icon_path))
+        icon = _window_icon()
+        if icon is not None:
+            self.setWindowIcon(icon)
         
         # Central widget with tabs
         central_widget = QWidget()
@@ -100,9 +226,11 @@ class MainWindow(QMainWindow):
         
         # Tab widget
         self.tabs = QTabWidget()
+        self.tabs.setObjectName("mainTabs")
         layout.addWidget(self.tabs)
         
-        # Create modular tabs with real managers
+        # Create modular tabs with real managers (imported here, off the splash path)
+        from app.gui.window_reset import ResetTab
         self.reset_tab = ResetTab(
             self.app_manager,
             self.statusBar(),
@@ -111,30 +239,16 @@ class MainWindow(QMainWindow):
             self.audio_manager
         )
         self.tabs.addTab(self.reset_tab, "🔄 Reset Data")
+        log_output = getattr(self.reset_tab, 'log_output', None)
+        self._log_append = log_output.append if log_output is not None else None
         
-        self.account_tab = AccountTab(
-            self.app_manager,
-            self.log
-        )
-        self.tabs.addTab(self.account_tab, "👤 Account Manager")
-        
-        self.advanced_tab = AdvancedTab(
-            self.app_manager,
-            self.log
-        )
-        self.tabs.addTab(self.advanced_tab, "⚙️ Advanced")
-        
-        # Add custom tab bar styling with better spacing
-        self.tabs.setStyleSheet("""
-            QTabWidget::pane {
-                border-top: 2px solid #3d3d3d;
-                margin-top: 2px;
-            }
-            QTabBar::tab {
-                padding: 8px 16px;
-                margin-right: 2px;
-            }
-        """)
+        # Account and Advanced tabs are built on first visit; placeholders
+        # hold their positions until then
+        self._lazy_tabs = {
+            self.tabs.addTab(QWidget(), "👤 Account Manager"): self._create_account_tab,
+            self.tabs.addTab(QWidget(), "⚙️ Advanced"): self._create_advanced_tab,
+        }
+        self.tabs.currentChanged.connect(self._ensure_tab_loaded)
         
         # Add GitHub button to tab bar
         self.add_corner_widgets_to_tabs()
@@ -146,13 +260,62 @@ class MainWindow(QMainWindow):
     
     def log(self, message: str):
         """Add message to log output."""
-        if hasattr(self, 'reset_tab') and hasattr(self.reset_tab, 'log_output'):
-            self.reset_tab.log_output.append(message)
-        debug_print(f"[LOG] {message}")
+        if self._log_append is not None:
+            self._log_append(message)
+        if DEBUG:
+            debug_print(f"[LOG] {message}")
     
     def apply_styles(self):
-        """Apply compact dark stylesheet."""
-        self.setStyleSheet(COMPACT_DARK_STYLE)
+        """Apply the consolidated dark stylesheet once, application-wide."""
+        app = QApplication.instance()
+        if app.styleSheet() != COMPACT_DARK_STYLE:
+            app.setStyleSheet(COMPACT_DARK_STYLE)
+    
+    @pyqtSlot(int)
+    def _ensure_tab_loaded(self, index):
+        """Construct a deferred tab the first time it is shown.
+        
+        Args:
+            index: Tab index that became current
+        """
+        factory = self._lazy_tabs.pop(index, None)
+        if factory is None:
+            return
+        
+        placeholder = self.tabs.widget(index)
+        label = self.tabs.tabText(index)
+        tab = factory()
+        
+        # Swap without re-entering this slot through currentChanged
+        self.tabs.blockSignals(True)
+        self.tabs.removeTab(index)
+        self.tabs.insertTab(index, tab, label)
+        self.tabs.setCurrentIndex(index)
+        self.tabs.blockSignals(False)
+        placeholder.deleteLater()
+    
+    def _create_account_tab(self):
+        """Build the Account Manager tab and replay current state into it."""
+        from app.gui.window_account import AccountTab
+        self.account_tab = AccountTab(
+            self.app_manager,
+            self.log
+        )
+        if getattr(self, 'current_user', None):
+            self.account_tab.set_current_user(self.current_user)
+        self.account_tab.update_detected_apps(self.detected_apps)
+        return self.account_tab
+    
+    def _create_advanced_tab(self):
+        """Build the Advanced tab and replay current state into it."""
+        from app.gui.window_advanced import AdvancedTab
+        self.advanced_tab = AdvancedTab(
+            self.app_manager,
+            self.log
+        )
+        if getattr(self, 'current_user', None):
+            self.advanced_tab.set_current_user(self.current_user)
+        return self.advanced_tab
     
     def add_corner_widgets_to_tabs(self):
         """Add user info and GitHub buttons to the right side of tab bar."""
@@ -168,52 +331,19 @@ class MainWindow(QMainWindow):
         self.user_btn.setMinimumWidth(USER_BUTTON_MIN_WIDTH)
         self.user_btn.setMaximumHeight(USER_BUTTON_MAX_HEIGHT)
         self.user_btn.setToolTip("Click to switch Windows user")
-        self.user_btn.setStyleSheet("""
-            QPushButton {
-                background: #4CAF50;
-                color: white;
-                border: 2px solid #45a049;
-                border-radius: 5px;
-                padding: 5px 10px;
-                font-size: 12px;
-                font-weight: bold;
-                text-align: center;
-            }
-            QPushButton:hover {
-                background: #5cbf60;
-            }
-            QPushButton:pressed {
-                background: #45a049;
-            }
-        """)
+        self.user_btn.setObjectName("userBtn")
         self.user_btn.clicked.connect(self.show_user_menu)
         corner_layout.addWidget(self.user_btn)
         
-        # Populate user list with delay
-        QTimer.singleShot(USER_LIST_REFRESH_DELAY_MS, self.refresh_user_list)
+        # User menu is built once and only repopulated when the user list changes
+        self._user_menu = QMenu(self)
+        self._user_menu.setObjectName("userMenu")
         
         # GitHub button (right)
         github_btn = QPushButton("🔗 SurfManager")
         github_btn.setFixedHeight(GITHUB_BUTTON_HEIGHT)
         github_btn.setFixedWidth(GITHUB_BUTTON_WIDTH)
-        github_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #0d7377;
-                color: #ffffff;
-                border: 1px solid #0a5a5d;
-                padding: 0px;
-                border-radius: 4px;
-                font-weight: bold;
-                font-size: 11px;
-            }
-            QPushButton:hover {
-                background-color: #0f8a8f;
-                border: 1px solid #0d7377;
-            }
-            QPushButton:pressed {
-                background-color: #0a5a5d;
-            }
-        """)
+        github_btn.setObjectName("githubBtn")
         github_btn.clicked.connect(self.open_github)
         corner_layout.addWidget(github_btn)
         
@@ -221,45 +351,35 @@ class MainWindow(QMainWindow):
         self.tabs.setCornerWidget(corner_widget, Qt.Corner.TopRightCorner)
     
     def refresh_user_list(self):
-        """Refresh Windows user list."""
+        """Refresh Windows user list in the background."""
+        debug_print("[DEBUG] Refreshing user list...")
+        runnable = UserListRunnable(self.user_manager)
+        runnable.signals.finished.connect(self._on_users_loaded)
+        runnable.signals.error.connect(self._on_users_error)
+        QThreadPool.globalInstance().start(runnable)
+    
+    @pyqtSlot(str)
+    def _on_users_error(self, error: str):
+        """Handle a failed user detection."""
+        debug_print(f"[DEBUG] Error refreshing user list: {error}")
+        self.user_btn.setText("👤 Error")
+    
+    @pyqtSlot(list)
+    def _on_users_loaded(self, users: list):
+        """Apply detected users to the UI (runs on the GUI thread)."""
         try:
-            import getpass
-            import os
-            
-            debug_print("[DEBUG] Refreshing user list...")
-            
-            # Get all users from system drive
-            system_drive = os.getenv('SystemDrive', 'C:')
-            if not system_drive.endswith('\\'):
-                system_drive += '\\'
-            users_dir = os.path.join(system_drive, 'Users')
-            self.all_users = []
-            self.current_user = getpass.getuser()
-            
-            debug_print(f"[DEBUG] Current user: {self.current_user}")
-            debug_print(f"[DEBUG] Scanning users directory: {users_dir}")
-            
-            if os.path.exists(users_dir):
-                exclude_dirs = {'Public', 'Default', 'Default User', 'All Users', 'desktop.ini'}
-                for item in os.listdir(users_dir):
-                    user_path = os.path.join(users_dir, item)
-                    debug_print(f"[DEBUG] Checking: {item} - isdir: {os.path.isdir(user_path)}")
-                    
-                    # Include all user directories
-                    if os.path.isdir(user_path) and item not in exclude_dirs:
-                        self.all_users.append(item)
-                        debug_print(f"[DEBUG] Added user: {item}")
+            # UserManager filters system profiles and sorts current user first
+            self.all_users = [user.username for user in users]
+            self.current_user = self.user_manager.current_user
             
             debug_print(f"[DEBUG] Found {len(self.all_users)} users: {self.all_users}")
             
-            # Sort: current user first
-            self.all_users.sort(key=lambda x: (x.lower() != self.current_user.lower(), x.lower()))
-            
             # Update button text
             self.user_btn.setText(f"👤 {self.current_user}")
             
             # Enable/disable button based on user count
             self.user_btn.setEnabled(len(self.all_users) > 0)
+            self._rebuild_user_menu()
             
             # Notify Account Manager tab about current user
             if hasattr(self, 'account_tab'):
@@ -273,45 +393,35 @@ class MainWindow(QMainWindow):
             debug_print(f"[DEBUG] Error refreshing user list: {e}")
             self.user_btn.setText("👤 Error")
     
+    def _rebuild_user_menu(self):
+        """Repopulate the cached user menu from the current user list."""
+        self._user_menu.clear()
+        current = self.current_user.lower()
+        for user in self.all_users:
+            display_name = f"👤 {user}"
+            if user.lower() == current:
+                display_name += " (Current)"
+            action = self._user_menu.addAction(display_name)
+            # triggered passes a 'checked' flag; bind the user and drop it
+            action.triggered.connect(lambda _checked=False, user=user: self.switch_user(user))
+    
+    @pyqtSlot()
     def show_user_menu(self):
         """Show user selection menu."""
         if not hasattr(self, 'all_users') or not self.all_users:
             return
         
-        menu = QMenu(self)
-        menu.setStyleSheet("""
-            QMenu {
-                background: #2d2d2d;
-                color: white;
-                border: 2px solid #4CAF50;
-                padding: 5px;
-            }
-            QMenu::item {
-                padding: 8px 20px;
-                border-radius: 4px;
-            }
-            QMenu::item:selected {
-                background: #4CAF50;
-            }
-        """)
-        
-        for user in self.all_users:
-            display_name = f"👤 {user}"
-            if user.lower() == self.current_user.lower():
-                display_name += " (Current)"
-            action = menu.addAction(display_name)
-            action.setData(user)
-        
-        action = menu.exec(self.user_btn.mapToGlobal(self.user_btn.rect().bottomLeft()))
-        if action:
-            selected_user = action.data()
-            self.switch_user(selected_user)
+        self._user_menu.exec(self.user_btn.mapToGlobal(self.user_btn.rect().bottomLeft()))
     
     def switch_user(self, username):
         """Switch to different user."""
         try:
+            if not self.user_manager.set_selected_user(username):
+                self.log(f"Cannot switch to user {username}: not in the detected user list")
+                return
             self.current_user = username
             self.user_btn.setText(f"👤 {username}")
+            self._rebuild_user_menu()
             self.log(f"Switched to user: {username}")
             
             # Update config
@@ -325,12 +435,13 @@ class MainWindow(QMainWindow):
             if hasattr(self, 'advanced_tab'):
                 self.advanced_tab.set_current_user(username)
             
-            # Trigger app scan
-            QTimer.singleShot(REFRESH_SCAN_DELAY_MS, lambda: self.scan_applications(force_rescan=True))
+            # Trigger app scan (debounced)
+            self.scan_applications(force_rescan=True)
             
         except Exception as e:
             self.log(f"Error switching user: {e}")
     
+    @pyqtSlot()
     def open_github(self):
         """Open GitHub repository in browser."""
         try:
@@ -340,43 +451,40 @@ class MainWindow(QMainWindow):
     
     def setup_shortcuts(self):
         """Setup keyboard shortcuts."""
-        # Debug shortcuts (only in debug/test mode)
-        if self.config_manager.get('debug_mode', False) or self.test_mode:
-            QShortcut(QKeySequence("Ctrl+Shift+D"), self, self.open_debug_panel)
-            QShortcut(QKeySequence("Ctrl+Shift+L"), self, self.show_log_viewer)
-            QShortcut(QKeySequence("Ctrl+Shift+T"), self, self.run_test_suite)
-        
-        # Normal shortcuts
-        QShortcut(QKeySequence("Ctrl+R"), self, self.scan_applications)
-        QShortcut(QKeySequence("F5"), self, self.scan_applications)
-        QShortcut(QKeySequence("Ctrl+Q"), self, self.close)
+        for sequence, slot_name in _SHORTCUTS:
+            QShortcut(QKeySequence(sequence), self, getattr(self, slot_name))
     
+    @pyqtSlot()
+    @pyqtSlot(bool)
     def scan_applications(self, force_rescan=False):
         """Scan for installed applications.
         
+        Requests arriving within SCAN_DEBOUNCE_MS are merged into a single scan.
+        
         Args:
             force_rescan: If True, perform full rescan. Otherwise just check running status.
         """
-        # Thread-safe check for running scan
-        locker = QMutexLocker(self.scan_mutex)
-        if self.scan_thread and self.scan_thread.isRunning():
-            self.log("Scan already in progress...")
+        self._pending_force_rescan = self._pending_force_rescan or force_rescan
+        self._scan_debounce.start()
+    
+    @pyqtSlot()
+    def _do_scan(self):
+        """Start the coalesced scan on the thread pool."""
+        # Scans are only started from the GUI thread, so no lock is needed here
+        if self._scan_in_flight:
+            # Keep the pending request and retry once the current scan is done
+            self._scan_debounce.start()
             return
-        locker.unlock()
+        
+        force_rescan = self._pending_force_rescan
+        self._pending_force_rescan = False
+        self._pending_log_details = force_rescan
         
         # Get selected user
         selected_user = self.current_user if hasattr(self, 'current_user') else None
         
-        # Update AppManager with selected user paths
+        # The scan points AppManager at the selected user's paths first
         if selected_user:
-            system_drive = os.getenv('SystemDrive', 'C:')
-            if not system_drive.endswith('\\'):
-                system_drive += '\\'
-            user_profile = os.path.join(system_drive, 'Users', selected_user)
-            appdata_roaming = os.path.join(user_profile, 'AppData', 'Roaming')
-            appdata_local = os.path.join(user_profile, 'AppData', 'Local')
-            self.app_manager.set_current_user(selected_user, appdata_roaming, appdata_local)
-            
             if force_rescan:
                 self.log(f"Scanning applications for user: {selected_user}")
         else:
@@ -385,68 +493,97 @@ class MainWindow(QMainWindow):
         
         self.status_bar.showMessage("Scanning for applications...")
         
-        self.scan_thread = ScanThread(self.app_manager, force_rescan=force_rescan)
-        self.scan_thread.progress.connect(self.status_bar.showMessage)
-        self.scan_thread.finished.connect(lambda apps: self.on_scan_finished(apps, log_details=force_rescan))
-        self.scan_thread.start()
+        runnable = ScanRunnable(self.app_manager, force_rescan=force_rescan,
+                                user_manager=self.user_manager, username=selected_user)
+        runnable.signals.progress.connect(self.status_bar.showMessage)
+        runnable.signals.finished.connect(self._on_scan_finished_slot)
+        runnable.signals.error.connect(self._on_scan_error)
+        self._scan_in_flight = True
+        QThreadPool.globalInstance().start(runnable)
+    
+    @pyqtSlot(str)
+    def _on_scan_error(self, error: str):
+        """Handle a scan that raised."""
+        self._scan_in_flight = False
+        self.log(f"Error scanning applications: {error}")
+        self.status_bar.showMessage("Scan failed")
+    
+    @pyqtSlot(object)
+    def _on_scan_finished_slot(self, payload: dict):
+        """Receive scan results; scans are serialized so the pending flag matches."""
+        self._scan_in_flight = False
+        self.on_scan_finished(payload['apps'], log_details=self._pending_log_details,
+                              installed_count=payload['count'],
+                              fingerprint=payload['fingerprint'])
     
-    def on_scan_finished(self, apps: dict, log_details: bool = True):
+    def on_scan_finished(self, apps: dict, log_details: bool = True,
+                         installed_count: int = None, fingerprint: tuple = None):
         """Handle scan completion.
         
         Args:
             apps: Dictionary of detected applications
             log_details: If True, log detailed information
+            installed_count: Installed app count precomputed by the scan, if known
+            fingerprint: Summary of installed/running/path per app; tabs are
+                only refreshed when it differs from the previous scan
         """
-        # Thread-safe update of detected apps
-        with self.detected_apps_lock:
-            self.detected_apps = apps.copy()
+        if installed_count is None:
+            installed_count = sum(map(_get_installed, apps.values()))
         
-        # Update tabs with detected apps
-        if hasattr(self.reset_tab, 'update_detected_apps'):
-            self.reset_tab.update_detected_apps(apps, log_details=log_details)
+        # Slots run on the GUI thread and the scan never touches apps again,
+        # so the dict is handed over by plain (atomic) rebinding, no copy
+        self.detected_apps = apps
+        
+        unchanged = fingerprint is not None and fingerprint == self._last_apps_fingerprint
+        self._last_apps_fingerprint = fingerprint
         
-        if hasattr(self.account_tab, 'update_detected_apps'):
-            self.account_tab.update_detected_apps(apps)
+        # Update tabs with detected apps
+        if not unchanged or log_details:
+            if hasattr(self.reset_tab, 'update_detected_apps'):
+                self.reset_tab.update_detected_apps(apps, log_details=log_details)
+            
+            if hasattr(self, 'account_tab'):
+                self.account_tab.update_detected_apps(apps)
 
         # Show essential scan results
         if log_details:
-            installed_apps = [name for name, info in apps.items() if info.get('installed', False)]
-            if installed_apps:
-                self.log(f"Found {len(installed_apps)} installed applications")
+            if installed_count:
+                self.log(f"Found {installed_count} installed applications")
             else:
                 self.log("No applications detected")
 
         # Show summary in status bar
-        installed_count = sum(1 for app in apps.values() if app.get('installed', False))
         self.status_bar.showMessage(f"Scan complete: {installed_count} apps detected")
     
-    def show_log_viewer(self):
-        """Show log viewer (test/debug mode only)."""
-        self.log("Log viewer: Feature not yet implemented")
-    
-    def run_test_suite(self):
-        """Run test suite (test/debug mode only)."""
-        self.log("Test suite: Feature not yet implemented")
-    
     def closeEvent(self, event):
         """Handle window close event."""
-        # Save window state and configuration
-        if self.config_manager:
-            self.config_manager.save_config()
-        
         # Only show confirmation in non-test mode
-        if not self.test_mode:
-            reply = QMessageBox.question(
-                self, 
-                'Exit SurfManager', 
-                'Are you sure you want to exit?',
-                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-                QMessageBox.StandardButton.No
-            )
-            
-            if reply == QMessageBox.StandardButton.Yes:
-                event.accept()
-            else:
-                event.ignore()
-        else:
+        if self.test_mode or self._close_confirmed:
+            # Save window state and configuration
+            if self.config_manager:
+                self.config_manager.save_config()
             event.accept()
+            return
+        
+        # Ask without a nested event loop; the reply slot re-issues close()
+        event.ignore()
+        if self._close_box is not None and self._close_box.isVisible():
+            return
+        
+        box = QMessageBox(self)
+        box.setIcon(QMessageBox.Icon.Question)
+        box.setWindowTitle('Exit SurfManager')
+        box.setText('Are you sure you want to exit?')
+        box.setStandardButtons(QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
+        box.setDefaultButton(QMessageBox.StandardButton.No)
+        apply_dark_theme(box)
+        box.buttonClicked.connect(self._handle_close_reply)
+        self._close_box = box
+        box.open()
+    
+    @pyqtSlot(QAbstractButton)
+    def _handle_close_reply(self, button):
+        """Close the window if the exit confirmation was accepted."""
+        if self._close_box.standardButton(button) == QMessageBox.StandardButton.Yes:
+            self._close_confirmed = True
+            self.close()
@@ -2,13 +2,12 @@
 import os
 import sys
 from PyQt6.QtWidgets import QSplashScreen
-from PyQt6.QtCore import Qt, QTimer
-from PyQt6.QtGui import QPixmap, QPainter, QColor, QFont, QPen
-from app.core.audio_manager import AudioManager
+from PyQt6.QtCore import Qt, QRect
+from PyQt6.QtGui import QPixmap, QPainter, QColor, QFont, QPen, QRegion
 
 
 class SplashScreen(QSplashScreen):
-    """Custom splash screen with loading animation."""
+    """Custom splash screen with loading progress."""
     
     def __init__(self):
         # Create a pixmap for the splash screen
@@ -22,24 +21,31 @@ class SplashScreen(QSplashScreen):
         self.progress = 0
         self.message = "Initializing..."
         
-        # Timer for animation
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.update_progress)
-        self.timer.start(30)
+        # Layout and fonts are fixed, so compute them once instead of per paint
+        width, height = pixmap.width(), pixmap.height()
+        self._bar_rect = self.rect().adjusted(100, 180, -100, -80)
+        self._message_rect = QRect(0, height - 60, width, 30)
+        self._title_font = QFont("Segoe UI", 32, QFont.Weight.Bold)
+        self._slogan_font = QFont("Segoe UI", 11)
+        self._msg_font = QFont("Segoe UI", 9)
         
-        # Audio manager
+        # Background, title, slogan and bar track never change; render them once
+        self._base_pixmap = self._render_base()
+        
+        # Audio manager (imported lazily so the splash can paint first)
+        from app.core.audio_manager import AudioManager
         self.audio_manager = AudioManager()
         
         # Try to load and play startup audio
         self.play_startup_audio()
         
-    def update_progress(self):
-        """Update progress animation - smooth continuous movement."""
-        if self.progress < 100:
-            self.progress += 0.5
-            if self.progress > 100:
-                self.progress = 100
-        self.repaint()
+    def set_progress(self, value: float):
+        """Set progress and repaint only the progress bar when it changed."""
+        value = max(0, min(100, value))
+        if value == self.progress:
+            return
+        self.progress = value
+        self.update(self._bar_rect)
     
     def play_startup_audio(self):
         """Play startup audio if available."""
@@ -48,60 +54,89 @@ class SplashScreen(QSplashScreen):
         except Exception as e:
             print(f"[SplashScreen] Failed to play startup audio: {e}")
     
+    def paintEvent(self, event):
+        """Paint only the parts of the splash inside the invalidated region."""
+        painter = QPainter(self)
+        self.drawContents(painter, event.region())
+        painter.end()
     
-    def drawContents(self, painter: QPainter):
-        """Draw custom splash screen contents."""
+    def _render_base(self) -> QPixmap:
+        """Pre-render the static parts of the splash into a pixmap."""
+        ratio = self.screen().devicePixelRatio() if self.screen() else 1.0
+        base = QPixmap(int(self.width() * ratio), int(self.height() * ratio))
+        base.setDevicePixelRatio(ratio)
+        
+        painter = QPainter(base)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
-        # Background gradient
+        # Background
         painter.fillRect(self.rect(), QColor(30, 30, 40))
         
         # Title
-        title_font = QFont("Segoe UI", 32, QFont.Weight.Bold)
-        painter.setFont(title_font)
+        painter.setFont(self._title_font)
         painter.setPen(QColor(100, 180, 255))
         painter.drawText(self.rect().adjusted(0, 60, 0, 0), 
                         Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignTop,
                         "SurfManager")
         
         # Slogan
-        slogan_font = QFont("Segoe UI", 11)
-        painter.setFont(slogan_font)
+        painter.setFont(self._slogan_font)
         painter.setPen(QColor(180, 180, 200))
         painter.drawText(self.rect().adjusted(0, 120, 0, 0),
                         Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignTop,
                         "Advanced Session & Data Manager")
         
         # Progress bar background
-        bar_rect = self.rect().adjusted(100, 180, -100, -80)
         painter.setPen(QPen(QColor(60, 60, 70), 2))
         painter.setBrush(QColor(40, 40, 50))
-        painter.drawRoundedRect(bar_rect, 5, 5)
-        
-        # Progress bar fill (animated)
-        progress_width = int((bar_rect.width() - 4) * (self.progress / 100))
-        fill_rect = bar_rect.adjusted(2, 2, -bar_rect.width() + progress_width + 2, -2)
-        
-        # Gradient for progress bar
-        gradient_color = QColor(100, 180, 255)
-        painter.setBrush(gradient_color)
-        painter.setPen(Qt.PenStyle.NoPen)
-        painter.drawRoundedRect(fill_rect, 3, 3)
-        
-        # Loading message
-        msg_font = QFont("Segoe UI", 9)
-        painter.setFont(msg_font)
-        painter.setPen(QColor(150, 150, 170))
-        painter.drawText(self.rect().adjusted(0, 0, 0, -30),
-                        Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignBottom,
-                        self.message)
+        painter.drawRoundedRect(self._bar_rect, 5, 5)
+        
+        painter.end()
+        return base
+    
+    def drawContents(self, painter: QPainter, region: QRegion = None):
+        """Draw custom splash screen contents.
+        
+        Args:
+            painter: Active painter for the splash
+            region: Invalidated region; None repaints everything
+        """
+        # Static parts, limited to the invalidated area
+        dirty = self.rect() if region is None else region.boundingRect()
+        painter.drawPixmap(dirty, self._base_pixmap, self._base_source_rect(dirty))
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        
+        if region is None or region.intersects(self._bar_rect):
+            # Progress bar fill
+            bar_rect = self._bar_rect
+            progress_width = int((bar_rect.width() - 4) * (self.progress / 100))
+            fill_rect = bar_rect.adjusted(2, 2, -bar_rect.width() + progress_width + 2, -2)
+            painter.setBrush(QColor(100, 180, 255))
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.drawRoundedRect(fill_rect, 3, 3)
+        
+        if region is None or region.intersects(self._message_rect):
+            # Loading message
+            painter.setFont(self._msg_font)
+            painter.setPen(QColor(150, 150, 170))
+            painter.drawText(self._message_rect,
+                            Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignBottom,
+                            self.message)
+    
+    def _base_source_rect(self, rect: QRect) -> QRect:
+        """Map a widget rect to device pixels in the base pixmap."""
+        ratio = self._base_pixmap.devicePixelRatio()
+        return QRect(int(rect.x() * ratio), int(rect.y() * ratio),
+                     int(rect.width() * ratio), int(rect.height() * ratio))
     
     def set_message(self, message: str):
-        """Set loading message."""
+        """Set loading message and schedule a repaint of its strip only."""
+        if message == self.message:
+            return
         self.message = message
-        self.repaint()
+        # update() coalesces back-to-back messages into one posted paint
+        self.update(self._message_rect)
     
     def finish_loading(self, main_window):
         """Finish loading and show main window."""
-        self.timer.stop()
         self.finish(main_window)
@@ -1,22 +1,46 @@
 """Theme loader for SurfManager - Loads styles from external QSS file."""
-from pathlib import Path
-from app.core.core_utils import get_resource_path, debug_print
+from functools import lru_cache
+from app.core.core_utils import get_resource_path, debug_print, is_debug_mode
+
+# Resolved once so release builds skip formatting debug messages
+DEBUG = is_debug_mode()
+
+
+@lru_cache(maxsize=4)
+def _read_stylesheet(path: str, mtime_ns: int) -> str:
+    """Read and decode a QSS file; cached per (path, mtime) pair.
+    
+    Args:
+        path: Absolute path to the QSS file
+        mtime_ns: Modification time, part of the cache key only
+    
+    Returns:
+        Decoded stylesheet text
+    """
+    # Binary read + single decode skips the TextIOWrapper layer
+    with open(path, 'rb') as f:
+        return f.read().decode('utf-8')
 
 
 def load_stylesheet() -> str:
     """Load main stylesheet from external QSS file.
     
+    Contents are memoized on the file's modification time, so repeated
+    calls only cost a stat() and an edited file is picked up again.
+    
     Returns:
         Stylesheet string or empty string if file not found
     """
     try:
         qss_path = get_resource_path('app/gui/styles.qss')
-        if qss_path.exists():
-            debug_print(f"Loading stylesheet from: {qss_path}")
-            return qss_path.read_text(encoding='utf-8')
-        else:
+        try:
+            mtime_ns = qss_path.stat().st_mtime_ns
+        except FileNotFoundError:
             debug_print(f"Stylesheet not found: {qss_path}")
             return ""
+        if DEBUG:
+            debug_print(f"Loading stylesheet from: {qss_path}")
+        return _read_stylesheet(str(qss_path), mtime_ns)
     except Exception as e:
         debug_print(f"Error loading stylesheet: {e}")
         return ""
@@ -25,26 +49,18 @@ def load_stylesheet() -> str:
 # Load stylesheet on import
 COMPACT_DARK_STYLE = load_stylesheet()
 
-# Fallback dialog style (minimal, kept inline)
-DARK_DIALOG_STYLE = """
-    QMessageBox, QDialog, QInputDialog {
-        background-color: #252526;
-        color: #cccccc;
-    }
-    QPushButton {
-        background-color: #404040;
-        color: #e0e0e0;
-        border: 1px solid #555555;
-        padding: 8px 16px;
-        border-radius: 4px;
-        min-width: 80px;
-    }
-    QPushButton:hover {
-        background-color: #505050;
-    }
-"""
-
 
 def apply_dark_theme(dialog):
-    """Apply dark theme to dialog."""
-    dialog.setStyleSheet(DARK_DIALOG_STYLE)
+    """Apply dark theme to dialog.
+    
+    Dialog rules live in the application stylesheet under the
+    [cls="darkDialog"] selector, so tagging the dialog is enough; no
+    per-dialog stylesheet is parsed. Every dialog the app builds should
+    call this; untagged dialogs only get the base QDialog background, not
+    the themed buttons and inputs.
+    """
+    dialog.setProperty("cls", "darkDialog")
+    if dialog.isVisible():
+        # Property selectors are resolved at polish time
+        dialog.style().unpolish(dialog)
+        dialog.style().polish(dialog)
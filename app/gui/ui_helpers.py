@@ -1,14 +1,26 @@
 """UI Helper utilities to reduce duplicate code across GUI modules."""
-from PyQt6.QtWidgets import QMessageBox, QInputDialog
+import re
+from PyQt6.QtWidgets import QMessageBox, QInputDialog, QDialog
 from app.gui.theme import apply_dark_theme
 
+# Characters not allowed in Windows file names
+_INVALID_FILENAME_CHARS = re.compile(r'[<>:"/\\|?*]')
+
+# str.translate table deleting ASCII control characters
+_CONTROL_CHARS = dict.fromkeys(range(32))
+
 
 class DialogHelper:
     """Centralized dialog utilities to reduce QMessageBox duplication."""
     
+    # When True (test/headless runs) dialogs are skipped and defaults returned
+    headless = False
+    
     @staticmethod
     def show_info(parent, title: str, message: str):
         """Show information dialog."""
+        if DialogHelper.headless:
+            return
         msg = QMessageBox(parent)
         msg.setIcon(QMessageBox.Icon.Information)
         msg.setWindowTitle(title)
@@ -19,6 +31,8 @@ class DialogHelper:
     @staticmethod
     def show_warning(parent, title: str, message: str):
         """Show warning dialog."""
+        if DialogHelper.headless:
+            return
         msg = QMessageBox(parent)
         msg.setIcon(QMessageBox.Icon.Warning)
         msg.setWindowTitle(title)
@@ -29,6 +43,8 @@ class DialogHelper:
     @staticmethod
     def show_error(parent, title: str, message: str):
         """Show error dialog."""
+        if DialogHelper.headless:
+            return
         msg = QMessageBox(parent)
         msg.setIcon(QMessageBox.Icon.Critical)
         msg.setWindowTitle(title)
@@ -39,6 +55,8 @@ class DialogHelper:
     @staticmethod
     def confirm(parent, title: str, message: str, default_no: bool = True) -> bool:
         """Show confirmation dialog. Returns True if Yes clicked."""
+        if DialogHelper.headless:
+            return False
         msg = QMessageBox(parent)
         msg.setIcon(QMessageBox.Icon.Question)
         msg.setWindowTitle(title)
@@ -53,6 +71,8 @@ class DialogHelper:
     @staticmethod
     def confirm_warning(parent, title: str, message: str, default_no: bool = True) -> bool:
         """Show warning confirmation dialog."""
+        if DialogHelper.headless:
+            return False
         msg = QMessageBox(parent)
         msg.setIcon(QMessageBox.Icon.Warning)
         msg.setWindowTitle(title)
@@ -67,14 +87,21 @@ class DialogHelper:
     @staticmethod
     def get_text(parent, title: str, label: str, default: str = "") -> tuple:
         """Show input dialog. Returns (text, ok)."""
-        text, ok = QInputDialog.getText(parent, title, label, text=default)
-        return text.strip() if ok else "", ok
+        if DialogHelper.headless:
+            return "", False
+        dialog = QInputDialog(parent)
+        dialog.setWindowTitle(title)
+        dialog.setLabelText(label)
+        dialog.setTextValue(default)
+        apply_dark_theme(dialog)
+        ok = dialog.exec() == QDialog.DialogCode.Accepted
+        return dialog.textValue().strip() if ok else "", ok
     
     @staticmethod
     def choose_app(parent, title: str, message: str) -> str:
         """Show app selection dialog. Returns 'windsurf', 'cursor', or empty string."""
-        from PyQt6.QtWidgets import QMessageBox
-        
+        if DialogHelper.headless:
+            return ""
         msg = QMessageBox(parent)
         msg.setWindowTitle(title)
         msg.setText(message)
@@ -83,7 +110,6 @@ class DialogHelper:
         cursor_btn = msg.addButton("Cursor", QMessageBox.ButtonRole.ActionRole)
         cancel_btn = msg.addButton("Cancel", QMessageBox.ButtonRole.RejectRole)
         
-        from app.gui.theme import apply_dark_theme
         apply_dark_theme(msg)
         
         msg.exec()
@@ -236,19 +262,17 @@ class ValidationHelper:
         Returns:
             (is_valid, error_message)
         """
-        import re
-        if re.search(r'[<>:"/\\|?*]', text):
+        if _INVALID_FILENAME_CHARS.search(text):
             return False, f"{field_name} contains invalid characters"
         return True, ""
     
     @staticmethod
     def sanitize_filename(filename: str) -> str:
         """Sanitize filename by removing invalid characters."""
-        import re
         # Remove invalid characters
-        sanitized = re.sub(r'[<>:"/\\|?*]', '_', filename)
+        sanitized = _INVALID_FILENAME_CHARS.sub('_', filename)
         # Remove control characters
-        sanitized = ''.join(char for char in sanitized if ord(char) >= 32)
+        sanitized = sanitized.translate(_CONTROL_CHARS)
         # Trim whitespace
         sanitized = sanitized.strip()
         return sanitized if sanitized else "unnamed"
@@ -1,18 +1,584 @@
 """Account Manager tab - Consistent style with Reset tab."""
 import os
+import sys
+import errno
 import json
 import shutil
+import getpass
+import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from functools import lru_cache
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLineEdit, QPushButton,
-    QTableWidget, QTableWidgetItem, QHeaderView, QGroupBox,
-    QMenu, QTextEdit, QGridLayout, QLabel
+    QTableView, QHeaderView, QGroupBox,
+    QMenu, QTextEdit, QGridLayout, QLabel, QProgressDialog
 )
 from app.gui.ui_helpers import DialogHelper, StyleHelper
-from PyQt6.QtCore import Qt, QTimer
+from app.gui.theme import apply_dark_theme
+from PyQt6.QtCore import (
+    Qt, QTimer, QObject, QRunnable, QThreadPool, QAbstractTableModel, QModelIndex,
+    QSortFilterProxyModel,
+    pyqtSignal, pyqtSlot
+)
 from PyQt6.QtGui import QBrush, QColor, QFont, QShortcut, QKeySequence
 from app.core.config_manager import ConfigManager
-from app.core.core_utils import open_folder_in_explorer, get_resource_path
+from app.core.core_utils import (
+    open_folder_in_explorer, get_resource_path, rmtree_scandir, SEARCH_DEBOUNCE_MS, LOG_FLUSH_DELAY_MS,
+    SESSION_REFRESH_DELAY_MS, PROGRESS_UPDATE_MS
+)
+
+
+# Hide the console window of helper commands on Windows (0 elsewhere)
+_CREATE_NO_WINDOW = getattr(subprocess, 'CREATE_NO_WINDOW', 0)
+
+# Process owner; looked up once rather than per AccountTab construction
+_CURRENT_USER = getpass.getuser()
+
+# Profile locations used to build backup paths; fixed for the process lifetime
+_HOME_DIR = os.path.expanduser("~")
+_SYSTEM_DRIVE = os.getenv('SystemDrive', 'C:').rstrip('\\') + '\\'
+_BACKUP_SUBDIR = f"Documents{os.sep}SurfManager{os.sep}Backups"  # relative to a profile
+
+
+@lru_cache(maxsize=16)
+def _normalized(path):
+    """Return the normalized form of a folder path handed to Explorer."""
+    return os.path.normpath(path)
+
+
+# Applications with a session folder under the backup path
+BACKUP_APPS = ('cursor', 'windsurf', 'claude')
+
+# File in each app folder naming its active session; replaces the older
+# per-session '.active' marker files, which are still honoured if no
+# pointer file exists yet
+ACTIVE_POINTER_FILE = 'active.txt'
+
+# Backups are dominated by large state databases; 1 MiB reads keep the
+# per-chunk Python overhead negligible
+_COPY_BUFSIZE = 1024 * 1024
+
+# Backup items and sessions are independent and I/O bound, so threads
+# overlap their copies and deletions
+COPY_WORKERS = 8
+DELETE_WORKERS = 8
+
+
+# Kernel-side copies: CopyFile2 on Windows (copy-on-write on ReFS),
+# sendfile between regular files on Linux
+_CopyFile2 = None
+if sys.platform == 'win32':
+    try:
+        import ctypes
+        _CopyFile2 = ctypes.WinDLL('kernel32').CopyFile2
+        _CopyFile2.argtypes = [ctypes.c_wchar_p, ctypes.c_wchar_p, ctypes.c_void_p]
+        _CopyFile2.restype = ctypes.c_long  # HRESULT
+    except (ImportError, OSError, AttributeError):
+        _CopyFile2 = None
+_HAS_SENDFILE = sys.platform.startswith('linux') and hasattr(os, 'sendfile')
+
+
+def _zero_copy(src, dst):
+    """Copy file contents without a userspace buffer where the OS allows it.
+    
+    Returns:
+        True if the contents were copied, False if the caller should fall
+        back to a buffered copy
+    """
+    if _CopyFile2 is not None:
+        return _CopyFile2(src, dst, None) >= 0
+    if _HAS_SENDFILE:
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            infd, outfd = fsrc.fileno(), fdst.fileno()
+            size = os.fstat(infd).st_size
+            offset = 0
+            try:
+                while offset < size:
+                    sent = os.sendfile(outfd, infd, offset, size - offset)
+                    if sent == 0:
+                        break
+                    offset += sent
+            except OSError:
+                return False  # e.g. filesystem without sendfile support
+        return True
+    return False
+
+
+def _copy_file(src, dst):
+    """Copy file contents and metadata (like shutil.copy2).
+    
+    Tries a kernel-side copy first and falls back to a 1 MiB buffered copy.
+    """
+    if not _zero_copy(src, dst):
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            shutil.copyfileobj(fsrc, fdst, _COPY_BUFSIZE)
+    shutil.copystat(src, dst)
+    return dst
+
+
+def _copy_item(source, dest):
+    """Copy one backup item (file or folder) to dest, creating parents."""
+    os.makedirs(os.path.dirname(dest), exist_ok=True)
+    if os.path.isfile(source):
+        _copy_file(source, dest)
+    else:
+        shutil.copytree(source, dest, copy_function=_copy_file, dirs_exist_ok=True)
+
+
+def _dir_size(path):
+    """Total size in bytes of all files under path.
+    
+    Uses scandir so each entry's stat comes from the directory listing
+    where the platform provides it, instead of a separate getsize call.
+    """
+    total = 0
+    stack = [path]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue  # Unreadable folders are skipped, as os.walk does
+        with it:
+            for entry in it:
+                if entry.is_file(follow_symlinks=False):
+                    total += entry.stat(follow_symlinks=False).st_size
+                elif entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+    return total
+
+
+# Parsed reset.json, shared by all backups and invalidated by file mtime
+_reset_config = None
+_reset_config_mtime = 0.0
+
+
+def _get_reset_config():
+    """Load reset.json once, re-reading it only if the file changed.
+    
+    Raises:
+        OSError, ValueError: If the file cannot be read or parsed
+    """
+    global _reset_config, _reset_config_mtime
+    config_path = get_resource_path('app/config/reset.json')
+    mtime = os.stat(config_path).st_mtime
+    if _reset_config is None or mtime != _reset_config_mtime:
+        with open(config_path, 'r') as f:
+            _reset_config = json.load(f)
+        _reset_config_mtime = mtime
+    return _reset_config
+
+
+def _read_active_session(app_folder):
+    """Read the active session name for an app folder.
+    
+    Returns:
+        Session name ('' if none is active), or None if the folder has no
+        pointer file and legacy '.active' markers must be checked
+    """
+    try:
+        with open(f"{app_folder}{os.sep}{ACTIVE_POINTER_FILE}", 'r', encoding='utf-8') as f:
+            return f.readline().strip()
+    except FileNotFoundError:
+        return None
+    except OSError:
+        return ''
+
+
+def _fast_rmtree(path):
+    """Delete a folder tree with the OS's own recursive delete.
+    
+    Uses 'rd /s /q' on Windows and 'rm -r' elsewhere, so large cache trees
+    are removed without per-entry Python overhead. Falls back to
+    rmtree_scandir when the command is unavailable.
+    
+    Raises:
+        FileNotFoundError: If the folder did not exist
+        OSError: If the folder could not be deleted
+    """
+    if sys.platform == 'win32':
+        # cmd expands %VAR% and !VAR! even inside quotes; leave such paths to
+        # rmtree_scandir. Quoting keeps & ^ ( ) literal, and '"' cannot occur in paths.
+        if '%' in path or '!' in path:
+            rmtree_scandir(path)
+            return
+        command = f'cmd /c rd /s /q "{path}"'
+    else:
+        # No -f, so a missing folder fails; stdin is not a tty, so no prompts
+        command = ['rm', '-r', '--', path]
+    
+    try:
+        result = subprocess.run(command, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                                stderr=subprocess.DEVNULL, creationflags=_CREATE_NO_WINDOW)
+    except FileNotFoundError:
+        rmtree_scandir(path)
+        return
+    
+    # Exit codes do not say what failed, so check the result directly:
+    # a failed command with nothing left behind means it was never there
+    if os.path.lexists(path):
+        raise OSError(f"Could not delete {path}")
+    if result.returncode != 0:
+        raise FileNotFoundError(errno.ENOENT, os.strerror(errno.ENOENT), path)
+
+
+def _safe_rmtree(path):
+    """Delete a folder tree.
+    
+    Returns:
+        Tuple of (success, error) where error is None on success
+    """
+    try:
+        _fast_rmtree(path)
+        return True, None
+    except Exception as e:
+        return False, e
+
+
+def _format_size(total):
+    """Format a byte count for the session list."""
+    if total < 1024:
+        return f"{total} B"
+    elif total < 1024 * 1024:
+        return f"{total / 1024:.1f} KB"
+    return f"{total / (1024 * 1024):.1f} MB"
+
+
+def _session_size(path, size_cache):
+    """Formatted size of a session folder, cached by folder mtime.
+    
+    Args:
+        path: Session folder path
+        size_cache: Dict of path -> (mtime, formatted size), updated in place
+    
+    Raises:
+        OSError: If the folder cannot be stat'ed
+    """
+    try:
+        mtime = os.stat(path).st_mtime
+    except FileNotFoundError:
+        return "0 KB"
+    
+    cached = size_cache.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    
+    size = _format_size(_dir_size(path))
+    size_cache[path] = (mtime, size)
+    return size
+
+
+class _SessionScanSignals(QObject):
+    """Signals for SessionScanRunnable (QRunnable is not a QObject)."""
+    finished = pyqtSignal(list, dict, list)  # rows, counts, log messages
+
+
+class SessionScanRunnable(QRunnable):
+    """Scan the backup folders for sessions on the thread pool."""
+    
+    def __init__(self, backup_path, size_cache):
+        super().__init__()
+        self.backup_path = backup_path
+        self.size_cache = size_cache
+        self.signals = _SessionScanSignals()
+    
+    def run(self):
+        """Collect sorted (app, name, created_ts, is_active, size, created_str) rows."""
+        counts = {}
+        messages = []
+        all_sessions = []
+        
+        # App folders are independent; scanning them concurrently overlaps
+        # their directory reads and size walks
+        with ThreadPoolExecutor(max_workers=len(BACKUP_APPS)) as executor:
+            for app, (rows, app_messages) in zip(BACKUP_APPS, executor.map(self._scan_app, BACKUP_APPS)):
+                counts[app] = len(rows)
+                messages.extend(app_messages)
+                all_sessions.extend(rows)
+        
+        # Sort: active first, then by date (newest first)
+        all_sessions.sort(key=lambda x: (not x[3], -x[2]))
+        
+        # Forget sizes of deleted sessions so the cache only holds listed ones
+        size_cache = self.size_cache
+        if len(size_cache) > len(all_sessions):
+            join = os.path.join
+            app_folders = {app: join(self.backup_path, app) for app in BACKUP_APPS}
+            live = {join(app_folders[row[0]], row[1]) for row in all_sessions}
+            for path in [path for path in size_cache if path not in live]:
+                del size_cache[path]
+        
+        self.signals.finished.emit(all_sessions, counts, messages)
+    
+    def _scan_app(self, app):
+        """Scan one app's backup folder.
+        
+        Returns:
+            Tuple of (rows, log messages) for the app
+        """
+        rows = []
+        messages = []
+        app_folder = os.path.join(self.backup_path, app)
+        
+        if os.path.exists(app_folder):
+            try:
+                # One pointer-file read per app instead of a stat per session
+                active_name = _read_active_session(app_folder)
+                
+                # DirEntry caches type (and on Windows, stat) data from the listing
+                with os.scandir(app_folder) as entries:
+                    for entry in entries:
+                        # Only include directories
+                        if not entry.is_dir(follow_symlinks=False):
+                            continue
+                        session_name = entry.name
+                        session_path = entry.path
+                        
+                        # Get folder creation time
+                        try:
+                            created_ts = entry.stat(follow_symlinks=False).st_ctime
+                            created_dt = datetime.fromtimestamp(created_ts)
+                        except (OSError, ValueError) as e:
+                            messages.append(f"⚠️ Could not get creation time for {session_name}: {e}")
+                            created_dt = datetime.now()
+                            created_ts = created_dt.timestamp()
+                        
+                        # Formatted once here; cheaper than strftime per paint
+                        created_str = (f"{created_dt.year:04d}-{created_dt.month:02d}-{created_dt.day:02d} "
+                                       f"{created_dt.hour:02d}:{created_dt.minute:02d}")
+                        
+                        # Check if this is the active session
+                        if active_name is not None:
+                            is_active = session_name == active_name
+                        else:
+                            is_active = os.path.exists(f"{session_path}{os.sep}.active")
+                        
+                        try:
+                            size = _session_size(session_path, self.size_cache)
+                        except OSError as e:
+                            messages.append(f"Warning: Could not calculate folder size: {e}")
+                            size = "Unknown"
+                        
+                        rows.append((app, session_name, created_ts, is_active, size, created_str))
+            except PermissionError as e:
+                messages.append(f"⚠️ Cannot access {app} folder: {e}")
+            except Exception as e:
+                messages.append(f"⚠️ Error scanning {app} folder: {e}")
+        
+        return rows, messages
+
+
+class _SessionDeleteSignals(QObject):
+    """Signals for DeleteAllSessionsRunnable."""
+    finished = pyqtSignal(int, int, list)  # deleted, failed, log messages
+
+
+class DeleteAllSessionsRunnable(QRunnable):
+    """Delete a list of session folders on the thread pool."""
+    
+    def __init__(self, session_paths):
+        super().__init__()
+        self.session_paths = session_paths
+        self.signals = _SessionDeleteSignals()
+    
+    def run(self):
+        deleted_count = 0
+        failed_count = 0
+        messages = []
+        session_paths = self.session_paths
+        
+        # Sessions are removed concurrently; rmtree releases the GIL in its syscalls
+        if session_paths:
+            with ThreadPoolExecutor(max_workers=min(DELETE_WORKERS, len(session_paths))) as executor:
+                for session_path, (ok, error) in zip(session_paths,
+                                                     executor.map(_safe_rmtree, session_paths)):
+                    if ok:
+                        deleted_count += 1
+                    else:
+                        failed_count += 1
+                        messages.append(f"❌ Failed to delete {os.path.basename(session_path)}: {error}")
+        
+        self.signals.finished.emit(deleted_count, failed_count, messages)
+
+
+class _DeleteSignals(QObject):
+    """Signals for SessionDeleteRunnable."""
+    finished = pyqtSignal(str, bool, object)  # session path, deleted, error
+
+
+class SessionDeleteRunnable(QRunnable):
+    """Delete a single session folder on the thread pool."""
+    
+    def __init__(self, session_path):
+        super().__init__()
+        self.session_path = session_path
+        self.signals = _DeleteSignals()
+    
+    def run(self):
+        ok, error = _safe_rmtree(self.session_path)
+        self.signals.finished.emit(self.session_path, ok, error)
+
+
+class SessionModel(QAbstractTableModel):
+    """Table model for backup sessions; cells are rendered on demand.
+    
+    Rows are (app, name, created_ts, is_active, size, created_str) tuples.
+    """
+    
+    HEADERS = ("#", "App", "Session Name", "Created", "Status")
+    
+    # Plain sort keys for the proxy, so sorting never compares display text
+    SORT_ROLE = Qt.ItemDataRole.UserRole
+    # Canonical (app, session name) for any cell of a row
+    SESSION_ROLE = Qt.ItemDataRole.UserRole + 1
+    HEADER_TIPS = (
+        "Row number",
+        "Application name (Cursor, Windsurf, Claude)",
+        "Backup session name - Right-click for actions",
+        "Backup creation timestamp",
+        "⭐ = Active session",
+    )
+    
+    # Shared by every cell instead of being rebuilt per refresh
+    _BRUSH_NUM_BG = QBrush(QColor("#404040"))
+    _BRUSH_ACTIVE_BG = QBrush(QColor("#2d4a2e"))
+    _BRUSH_ACTIVE_FG = QBrush(QColor("#a8e6a3"))
+    _BRUSH_INACTIVE_FG = QBrush(QColor("#888"))
+    _FONT_BOLD = QFont("", -1, QFont.Weight.Bold)
+    
+    # role -> {(is_active, column): value}; cells not listed use the defaults
+    _STYLES = {
+        Qt.ItemDataRole.FontRole: {
+            (False, 1): _FONT_BOLD,
+            (True, 0): _FONT_BOLD, (True, 1): _FONT_BOLD,
+            (True, 2): _FONT_BOLD, (True, 4): _FONT_BOLD,
+        },
+        Qt.ItemDataRole.BackgroundRole: {
+            (True, 0): _BRUSH_NUM_BG,
+            (True, 2): _BRUSH_ACTIVE_BG, (True, 4): _BRUSH_ACTIVE_BG,
+        },
+        Qt.ItemDataRole.ForegroundRole: {
+            (True, 2): _BRUSH_ACTIVE_FG, (True, 4): _BRUSH_ACTIVE_FG,
+            (False, 4): _BRUSH_INACTIVE_FG,
+        },
+    }
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        self._search_keys = []  # lowercased session names, one per row
+    
+    def set_rows(self, rows):
+        """Replace all rows with a single model reset."""
+        self.beginResetModel()
+        self._rows = rows
+        self._search_keys = [row[1].lower() for row in rows]
+        self.endResetModel()
+    
+    def search_key(self, row):
+        """Lowercased session name of a row, matched by the search box."""
+        return self._search_keys[row]
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation != Qt.Orientation.Horizontal:
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return self.HEADER_TIPS[section]
+        return None
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row, column = index.row(), index.column()
+        
+        # Styling roles are plain table lookups on the shared brushes/font
+        styles = self._STYLES.get(role)
+        if styles is not None:
+            return styles.get((self._rows[row][3], column))
+        if role == self.SORT_ROLE:
+            return self._sort_key(row, column)
+        if role == self.SESSION_ROLE:
+            return self._rows[row][:2]
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        
+        app, name, _, is_active, size, created_str = self._rows[row]
+        if column == 0:
+            return str(row + 1)
+        if column == 1:
+            return app.title()
+        if column == 2:
+            return f"⭐ {name} - {size}" if is_active else f"{name} - {size}"
+        if column == 3:
+            return created_str
+        return "✅ Active" if is_active else "⚪ Ready"
+    
+    def _sort_key(self, row, column):
+        """Sort key for a cell.
+        
+        Rows arrive active-first and newest-first, so the row number sorts
+        by that order and status ties keep it.
+        """
+        app, name, created_ts, is_active = self._rows[row][:4]
+        if column == 1:
+            return app
+        if column == 2:
+            return self._search_keys[row]
+        if column == 3:
+            return created_ts
+        if column == 4:
+            return 0 if is_active else 1
+        return row
+
+
+class SessionFilterProxy(QSortFilterProxyModel):
+    """Proxy filtering sessions by name, narrowing from the previous result.
+    
+    While typing, each query usually extends the last one, so only rows
+    that matched before can still match. Those are re-tested; every other
+    row is rejected with a set lookup instead of a substring search.
+    """
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._needle = ""
+        self._candidates = None  # rows that may still match, None for all rows
+        self._visible = set()  # rows accepted by the current filter
+    
+    def setSourceModel(self, model):
+        super().setSourceModel(model)
+        # Row numbers change on reset, so earlier matches no longer apply
+        model.modelAboutToBeReset.connect(self._forget_matches)
+    
+    def _forget_matches(self):
+        self._candidates = None
+        self._visible = set()
+    
+    def set_query(self, text):
+        """Filter rows whose session name contains text (case-insensitive)."""
+        needle = text.lower()
+        self._candidates = self._visible if needle.startswith(self._needle) else None
+        self._needle = needle
+        self._visible = set()
+        self.invalidateFilter()
+        self._candidates = None
+    
+    def filterAcceptsRow(self, source_row, source_parent):
+        candidates = self._candidates
+        if candidates is not None and source_row not in candidates:
+            return False
+        if self._needle not in self.sourceModel().search_key(source_row):
+            return False
+        self._visible.add(source_row)
+        return True
 
 
 class AccountTab(QWidget):
@@ -23,15 +589,66 @@ class AccountTab(QWidget):
         self.app_manager = app_manager
         self.log_callback = log_callback
         self.config_manager = ConfigManager()
-        self.session_backup_path = ""
+        self.session_backup_path = ""  # also builds self._app_folders
         self.current_user = None
+        self._size_cache = {}  # session path -> (folder mtime, formatted size)
+        self._stale_sizes = set()  # session paths rewritten in place, evicted before the next scan
+        self._refresh_in_flight = False
+        self._refresh_pending = False
+        self._last_folder_sig = None  # (backup path, app folder mtimes) of the last scan
+        
+        # Batch delete progress; one SessionDeleteRunnable per selected session
+        self._batch_pending = 0
+        self._batch_deleted = 0
+        self._batch_failed = 0
+        self._batch_lines = []
+        self._batch_progress = None
+        self._progress_timer = QTimer(self)  # repaints the dialog at most every 50 ms
+        self._progress_timer.setInterval(PROGRESS_UPDATE_MS)
+        self._progress_timer.timeout.connect(self._update_batch_progress)
+        
+        # Log lines are batched and appended in one document edit per flush
+        self._log_buffer = []
+        self._log_timer = QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(LOG_FLUSH_DELAY_MS)
+        self._log_timer.timeout.connect(self._flush_log)
+        
+        # Back-to-back single deletes coalesce into one forced rescan
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(SESSION_REFRESH_DELAY_MS)
+        self._refresh_timer.timeout.connect(lambda: self.refresh_list(force=True))
         self.init_ui()
         self.init_sessions()
         
+    @property
+    def session_backup_path(self):
+        """Root folder holding one session folder per app."""
+        return self._session_backup_path
+    
+    @session_backup_path.setter
+    def session_backup_path(self, path):
+        self._session_backup_path = path
+        # Per-app folders are joined once here; session paths append to them
+        self._app_folders = {app: os.path.join(path, app) for app in BACKUP_APPS}
+    
+    def _session_path(self, app, session):
+        """Path of a session folder."""
+        return f"{self._app_folders[app]}{os.sep}{session}"
+    
     def log(self, msg):
-        """Log only to Account Manager's own log output."""
-        if hasattr(self, 'log_output'):
-            self.log_output.append(msg)
+        """Log only to Account Manager's own log output (flushed in batches)."""
+        self._log_buffer.append(msg)
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+    
+    @pyqtSlot()
+    def _flush_log(self):
+        """Append all buffered log lines to the log view at once."""
+        if self._log_buffer:
+            self.log_output.append('\n'.join(self._log_buffer))
+            self._log_buffer.clear()
     
     def init_ui(self):
         """Initialize UI - consistent with Reset tab style."""
@@ -63,7 +680,7 @@ class AccountTab(QWidget):
     def setup_shortcuts(self):
         """Setup keyboard shortcuts for common actions."""
         # F5: Refresh session list
-        QShortcut(QKeySequence("F5"), self).activated.connect(self.refresh_list)
+        QShortcut(QKeySequence("F5"), self).activated.connect(lambda: self.refresh_list(force=True))
         
         # Ctrl+O: Open backup folder
         QShortcut(QKeySequence("Ctrl+O"), self).activated.connect(self.open_folder)
@@ -112,40 +729,58 @@ class AccountTab(QWidget):
         self.search_input.setPlaceholderText("🔍 Search sessions...")
         self.search_input.setToolTip("Search sessions (Ctrl+F to focus)")
         self.search_input.setMaximumWidth(250)
-        self.search_input.textChanged.connect(self.filter_sessions)
+        # Filter once typing pauses instead of on every keystroke
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(SEARCH_DEBOUNCE_MS)
+        self._filter_timer.timeout.connect(self._apply_filter)
+        self.search_input.textChanged.connect(self._filter_timer.start)
+        self._filter_text = ""  # text the proxy is currently filtered by
         top_bar.addWidget(self.search_input)
         
         left_layout.addLayout(top_bar)
         
         # Session Table
-        self.session_table = QTableWidget()
-        self.session_table.setMinimumHeight(350)
-        self.session_table.setColumnCount(5)
-        self.session_table.setHorizontalHeaderLabels(["#", "App", "Session Name", "Created", "Status"])
+        # Model/view table: cells are produced on demand by SessionModel
+        # (header labels and tooltips come from headerData)
+        self._model = SessionModel(self)
         
-        # Add tooltips to headers
-        self.session_table.horizontalHeaderItem(0).setToolTip("Row number")
-        self.session_table.horizontalHeaderItem(1).setToolTip("Application name (Cursor, Windsurf, Claude)")
-        self.session_table.horizontalHeaderItem(2).setToolTip("Backup session name - Right-click for actions")
-        self.session_table.horizontalHeaderItem(3).setToolTip("Backup creation timestamp")
-        self.session_table.horizontalHeaderItem(4).setToolTip("⭐ = Active session")
+        # Sorting runs in C++ inside the proxy; filtering narrows incrementally
+        self._proxy = SessionFilterProxy(self)
+        self._proxy.setSourceModel(self._model)
+        self._proxy.setSortRole(SessionModel.SORT_ROLE)
+        
+        self.session_table = QTableView()
+        self.session_table.setModel(self._proxy)
+        self.session_table.setMinimumHeight(350)
         
         self.session_table.verticalHeader().setVisible(False)
-        self.session_table.setSortingEnabled(True)
+        # Rows arrive presorted; sorting is only switched on once a header is clicked
+        self.session_table.horizontalHeader().sectionClicked.connect(self._enable_sorting)
         self.session_table.setAlternatingRowColors(True)
-        self.session_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.session_table.setSelectionMode(QTableWidget.SelectionMode.ExtendedSelection)
-        self.session_table.itemSelectionChanged.connect(self.update_selection_count)
+        self.session_table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        self.session_table.setSelectionMode(QTableView.SelectionMode.ExtendedSelection)
+        self.session_table.selectionModel().selectionChanged.connect(self.update_selection_count)
         
         # Column widths
         header = self.session_table.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.ResizeMode.Fixed)
         header.setSectionResizeMode(1, QHeaderView.ResizeMode.Fixed)
         header.setSectionResizeMode(2, QHeaderView.ResizeMode.Stretch)
-        header.setSectionResizeMode(3, QHeaderView.ResizeMode.ResizeToContents)
-        header.setSectionResizeMode(4, QHeaderView.ResizeMode.ResizeToContents)
+        header.setSectionResizeMode(3, QHeaderView.ResizeMode.Fixed)
+        header.setSectionResizeMode(4, QHeaderView.ResizeMode.Fixed)
         self.session_table.setColumnWidth(0, 35)
         self.session_table.setColumnWidth(1, 80)
+        # Fixed widths: ResizeToContents would measure every row on each refresh
+        self.session_table.setColumnWidth(3, 120)
+        self.session_table.setColumnWidth(4, 90)
+        
+        # Fixed row height and no wrapping, so layout skips per-row measuring
+        row_header = self.session_table.verticalHeader()
+        row_header.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        row_header.setDefaultSectionSize(26)
+        self.session_table.setWordWrap(False)
+        self.session_table.setTextElideMode(Qt.TextElideMode.ElideRight)
         
         # Context menu
         self.session_table.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
@@ -199,7 +834,8 @@ class AccountTab(QWidget):
         refresh_btn.setMinimumWidth(120)
         refresh_btn.setMinimumHeight(40)
         refresh_btn.setToolTip("Refresh session list (F5)")
-        refresh_btn.clicked.connect(self.refresh_list)
+        # Manual refreshes always rescan; the mtime check only skips automatic ones
+        refresh_btn.clicked.connect(lambda: self.refresh_list(force=True))
         right_layout.addWidget(refresh_btn)
         
         right_layout.addSpacing(5)
@@ -253,9 +889,9 @@ class AccountTab(QWidget):
         if backup_loc and os.path.isabs(backup_loc):
             self.session_backup_path = backup_loc
         elif backup_loc:
-            self.session_backup_path = os.path.join(os.path.expanduser("~"), backup_loc)
+            self.session_backup_path = os.path.join(_HOME_DIR, backup_loc)
         else:
-            self.session_backup_path = os.path.join(os.path.expanduser("~"), "Documents", "SurfManager", "Backups")
+            self.session_backup_path = os.path.join(_HOME_DIR, "Documents", "SurfManager", "Backups")
         
         # Create directory with error handling
         try:
@@ -264,54 +900,61 @@ class AccountTab(QWidget):
             self.log(f"⚠️ Cannot create backup folder: {self.session_backup_path}")
             self.log(f"⚠️ Using fallback location...")
             # Fallback to current user's Documents
-            self.session_backup_path = os.path.join(os.path.expanduser("~"), "Documents", "SurfManager", "Backups")
+            self.session_backup_path = os.path.join(_HOME_DIR, "Documents", "SurfManager", "Backups")
             os.makedirs(self.session_backup_path, exist_ok=True)
         
         # Get current user from environment
-        import getpass
-        self.current_user = getpass.getuser()
+        self.current_user = _CURRENT_USER
         
         QTimer.singleShot(100, self.refresh_list)
     
-    def refresh_list(self):
-        """Refresh session list by scanning backup folders."""
-        all_sessions = []
-        counts = {'cursor': 0, 'windsurf': 0, 'claude': 0}
+    def refresh_list(self, force=False):
+        """Refresh session list by scanning backup folders on the thread pool.
+        
+        Args:
+            force: Rescan even if no app folder changed since the last scan.
+                Callers that modify sessions pass True, since edits inside a
+                session folder do not change the app folder's mtime.
+        """
+        # Scans are serialized; a request during a scan reruns it once after
+        if self._refresh_in_flight:
+            self._refresh_pending = True
+            return
+        
+        sig = self._folder_signature()
+        if not force and sig == self._last_folder_sig:
+            return
+        self._last_folder_sig = sig
         
         # Log current backup path for debugging
         self.log(f"🔍 Scanning backup path: {self.session_backup_path}")
         
-        # Scan backup folders for each app
-        for app in ['cursor', 'windsurf', 'claude']:
-            app_folder = os.path.join(self.session_backup_path, app)
-            
-            if os.path.exists(app_folder):
-                try:
-                    for session_name in os.listdir(app_folder):
-                        session_path = os.path.join(app_folder, session_name)
-                        
-                        # Only include directories
-                        if os.path.isdir(session_path):
-                            # Get folder creation time
-                            try:
-                                created_time = os.path.getctime(session_path)
-                                created_dt = datetime.fromtimestamp(created_time)
-                            except (OSError, ValueError) as e:
-                                self.log(f"⚠️ Could not get creation time for {session_name}: {e}")
-                                created_dt = datetime.now()
-                            
-                            # Check if this is active session (has .active marker file)
-                            is_active = os.path.exists(os.path.join(session_path, '.active'))
-                            
-                            all_sessions.append((app, session_name, created_dt, is_active))
-                            counts[app] += 1
-                except PermissionError as e:
-                    self.log(f"⚠️ Cannot access {app} folder: {e}")
-                except Exception as e:
-                    self.log(f"⚠️ Error scanning {app} folder: {e}")
+        # No scan is running here, so the shared cache can be edited safely
+        for path in self._stale_sizes:
+            self._size_cache.pop(path, None)
+        self._stale_sizes.clear()
         
-        # Sort: active first, then by date (newest first)
-        all_sessions.sort(key=lambda x: (not x[3], -x[2].timestamp()))
+        runnable = SessionScanRunnable(self.session_backup_path, self._size_cache)
+        runnable.signals.finished.connect(self._on_sessions_scanned)
+        self._refresh_in_flight = True
+        QThreadPool.globalInstance().start(runnable)
+    
+    def _folder_signature(self):
+        """Backup path plus the mtime of each app folder (0 if missing)."""
+        mtimes = []
+        for app_folder in self._app_folders.values():
+            try:
+                mtimes.append(os.stat(app_folder).st_mtime)
+            except OSError:
+                mtimes.append(0)
+        return (self.session_backup_path, tuple(mtimes))
+    
+    @pyqtSlot(list, dict, list)
+    def _on_sessions_scanned(self, all_sessions, counts, messages):
+        """Populate the table from a finished scan."""
+        self._refresh_in_flight = False
+        for message in messages:
+            self.log(message)
         
         # Update count label
         total = len(all_sessions)
@@ -321,83 +964,44 @@ class AccountTab(QWidget):
         # Enable/disable Delete All button based on total sessions
         self.delete_all_btn.setEnabled(total > 0)
         
-        # Update table
-        self.session_table.setSortingEnabled(False)
-        self.session_table.setRowCount(len(all_sessions))
-        
-        for row, (app, name, created_dt, is_active) in enumerate(all_sessions):
-            # Row number
-            number_item = QTableWidgetItem(str(row + 1))
-            if is_active:
-                number_item.setBackground(QBrush(QColor("#404040")))
-                number_item.setFont(QFont("", -1, QFont.Weight.Bold))
-            self.session_table.setItem(row, 0, number_item)
-            
-            # App name
-            app_item = QTableWidgetItem(app.title())
-            app_item.setFont(QFont("", -1, QFont.Weight.Bold))
-            self.session_table.setItem(row, 1, app_item)
-            
-            # Session name with size
-            size = self.get_size(app, name)
-            display_name = f"⭐ {name} - {size}" if is_active else f"{name} - {size}"
-            
-            name_item = QTableWidgetItem(display_name)
-            if is_active:
-                name_item.setBackground(QBrush(QColor("#2d4a2e")))
-                name_item.setForeground(QBrush(QColor("#a8e6a3")))
-                name_item.setFont(QFont("", -1, QFont.Weight.Bold))
-            self.session_table.setItem(row, 2, name_item)
-            
-            # Created date
-            created_str = created_dt.strftime('%Y-%m-%d %H:%M')
-            self.session_table.setItem(row, 3, QTableWidgetItem(created_str))
-            
-            # Status
-            if is_active:
-                status_item = QTableWidgetItem("✅ Active")
-                status_item.setBackground(QBrush(QColor("#2d4a2e")))
-                status_item.setForeground(QBrush(QColor("#a8e6a3")))
-                status_item.setFont(QFont("", -1, QFont.Weight.Bold))
-            else:
-                status_item = QTableWidgetItem("⚪ Ready")
-                status_item.setForeground(QBrush(QColor("#888")))
-            self.session_table.setItem(row, 4, status_item)
+        # Update table with a single model reset; the proxy reapplies the
+        # active filter and any user-chosen sort
+        self._model.set_rows(all_sessions)
         
+        if self._refresh_pending:
+            self._refresh_pending = False
+            self.refresh_list(force=True)
+    
+    @pyqtSlot(int)
+    def _enable_sorting(self, section):
+        """Turn on header sorting the first time a column header is clicked."""
+        header = self.session_table.horizontalHeader()
+        header.sectionClicked.disconnect(self._enable_sorting)
+        header.setSortIndicator(section, Qt.SortOrder.AscendingOrder)
         self.session_table.setSortingEnabled(True)
     
-    def get_size(self, app, name):
-        """Get backup size."""
-        try:
-            path = os.path.join(self.session_backup_path, app, name)
-            if not os.path.exists(path):
-                return "0 KB"
-            total = sum(os.path.getsize(os.path.join(dp, f)) for dp, _, files in os.walk(path) for f in files)
-            if total < 1024:
-                return f"{total} B"
-            elif total < 1024 * 1024:
-                return f"{total / 1024:.1f} KB"
-            else:
-                return f"{total / (1024 * 1024):.1f} MB"
-        except (OSError, PermissionError) as e:
-            self.log(f"Warning: Could not calculate folder size: {e}")
-            return "Unknown"
+    def _apply_filter(self):
+        """Apply the search box text once the debounce timer fires."""
+        text = self.search_input.text()
+        # Typing and erasing back to the same text within the window is a no-op
+        if text != self._filter_text:
+            self.filter_sessions(text)
     
     def filter_sessions(self, text):
         """Filter sessions by search text."""
-        text = text.lower()
-        for row in range(self.session_table.rowCount()):
-            item = self.session_table.item(row, 2)
-            if item:
-                self.session_table.setRowHidden(row, text not in item.text().lower())
+        self._filter_text = text
+        self._proxy.set_query(text)
+    
+    def _session_for_index(self, index):
+        """Get (app, session name) for a view (proxy) index."""
+        return index.data(SessionModel.SESSION_ROLE)
     
     def show_context_menu(self, pos):
         """Show context menu."""
-        item = self.session_table.itemAt(pos)
-        if not item:
+        index = self.session_table.indexAt(pos)
+        if not index.isValid():
             return
         
-        row = self.session_table.row(item)
         selected_rows = self.session_table.selectionModel().selectedRows()
         
         menu = QMenu(self)
@@ -413,14 +1017,7 @@ class AccountTab(QWidget):
                 self.batch_delete_sessions()
         else:
             # Single selection menu - full options
-            app_item = self.session_table.item(row, 1)
-            name_item = self.session_table.item(row, 2)
-            
-            if not app_item or not name_item:
-                return
-            
-            app = app_item.text().lower()
-            session = name_item.text().replace("⭐ ", "").split(" - ")[0]
+            app, session = self._session_for_index(index)
             
             restore = menu.addAction("🔄 Restore Session")
             update = menu.addAction("💾 Update Backup")
@@ -443,7 +1040,7 @@ class AccountTab(QWidget):
             elif action == rename:
                 self.rename_session(app, session)
             elif action == open_f:
-                path = os.path.join(self.session_backup_path, app, session)
+                path = self._session_path(app, session)
                 open_folder_in_explorer(path)
                 self.log(f"📂 Opened: {session}")
             elif action == delete:
@@ -482,7 +1079,7 @@ class AccountTab(QWidget):
         backup_name = f"{app_name}-{name.strip()}"
         
         # Check if backup already exists
-        backup_path = os.path.join(self.session_backup_path, app_name, backup_name)
+        backup_path = self._session_path(app_name, backup_name)
         if os.path.exists(backup_path):
             DialogHelper.show_warning(self, "Exists", "Backup name already exists!")
             return
@@ -492,39 +1089,46 @@ class AccountTab(QWidget):
         try:
             if self.backup_data(app_name, backup_name, app_info["path"]):
                 DialogHelper.show_info(self, "Success", f"Backup '{backup_name}' created!")
-                self.refresh_list()
+                self.refresh_list(force=True)
         except Exception as e:
             self.log(f"❌ Failed: {e}")
     
     def backup_data(self, app, name, path):
         """Perform backup."""
         try:
-            backup_path = os.path.join(self.session_backup_path, app, name)
+            backup_path = self._session_path(app, name)
             os.makedirs(backup_path, exist_ok=True)
             
-            config_path = get_resource_path('app/config/reset.json')
-            with open(config_path, 'r') as f:
-                config = json.load(f)
+            config = _get_reset_config()
             
             items = config.get(app, {}).get('backup_items', [])
             backed_up = 0
             
+            tasks = []
             for item in items:
                 source = os.path.join(path, item)
                 if os.path.exists(source):
-                    dest = os.path.join(backup_path, item)
-                    os.makedirs(os.path.dirname(dest), exist_ok=True)
-                    
-                    try:
-                        if os.path.isfile(source):
-                            shutil.copy2(source, dest)
-                        else:
-                            shutil.copytree(source, dest, dirs_exist_ok=True)
-                        backed_up += 1
-                        self.log(f"✅ Backed up: {item}")
-                    except Exception as e:
-                        self.log(f"⚠️ Skip {item}: {e}")
+                    tasks.append((item, source, os.path.join(backup_path, item)))
+            
+            if tasks:
+                # Workers only copy; results are logged here on the GUI thread
+                with ThreadPoolExecutor(max_workers=min(COPY_WORKERS, len(tasks))) as executor:
+                    futures = {
+                        executor.submit(_copy_item, source, dest): item
+                        for item, source, dest in tasks
+                    }
+                    for future in as_completed(futures):
+                        item = futures[future]
+                        try:
+                            future.result()
+                            backed_up += 1
+                            self.log(f"✅ Backed up: {item}")
+                        except Exception as e:
+                            self.log(f"⚠️ Skip {item}: {e}")
             
+            # Copying into existing folders leaves the session root's mtime
+            # unchanged, so its cached size must be dropped explicitly
+            self._stale_sizes.add(backup_path)
             self.log(f"✅ Backup complete: {backed_up} items")
             return True
             
@@ -545,24 +1149,31 @@ class AccountTab(QWidget):
         
         self.app_manager.kill_app_process(app)
         
-        backup_path = os.path.join(self.session_backup_path, app, session)
+        backup_path = self._session_path(app, session)
         app_path = app_info["path"]
         
         try:
-            for item in os.listdir(backup_path):
-                source = os.path.join(backup_path, item)
-                dest = os.path.join(app_path, item)
-                
-                if os.path.exists(dest):
-                    if os.path.isfile(dest):
+            with os.scandir(backup_path) as entries:
+                for entry in entries:
+                    source = entry.path
+                    dest = os.path.join(app_path, entry.name)
+                    
+                    # Remove whatever is at dest without probing it first
+                    try:
                         os.remove(dest)
+                    except FileNotFoundError:
+                        pass
+                    except OSError:
+                        # Only a directory (IsADirectoryError, or PermissionError on
+                        # Windows) falls back to rmtree; a locked file is reported
+                        if not os.path.isdir(dest):
+                            raise
+                        shutil.rmtree(dest)
+                    
+                    if entry.is_file():
+                        _copy_file(source, dest)
                     else:
-                        shutil.rmtree(dest, ignore_errors=True)
-                
-                if os.path.isfile(source):
-                    shutil.copy2(source, dest)
-                else:
-                    shutil.copytree(source, dest)
+                        shutil.copytree(source, dest, copy_function=_copy_file)
             
             self.set_active(app, session)
             self.log(f"✅ Restored: {session}")
@@ -596,42 +1207,31 @@ class AccountTab(QWidget):
         """Complete backup update after app is closed."""
         self.backup_data(app, session, app_path)
         self.log(f"✅ Updated: {session}")
-        self.refresh_list()
+        self.refresh_list(force=True)
     
     def set_active(self, app, session):
-        """Set session as active using .active marker file."""
-        app_folder = os.path.join(self.session_backup_path, app)
-        
-        # Remove all .active markers for this app
-        if os.path.exists(app_folder):
-            for folder_name in os.listdir(app_folder):
-                marker_file = os.path.join(app_folder, folder_name, '.active')
-                if os.path.exists(marker_file):
-                    try:
-                        os.remove(marker_file)
-                    except (OSError, PermissionError):
-                        pass  # Expected - file may be in use
-        
-        # Set new active session
-        session_path = os.path.join(app_folder, session)
-        if os.path.exists(session_path):
-            marker_file = os.path.join(session_path, '.active')
+        """Set session as active by writing the app's pointer file."""
+        self._write_active_session(app, session)
+        self.refresh_list(force=True)
+        self.log(f"⭐ Active: {session}")
+    
+    def _write_active_session(self, app, session):
+        """Record session as the app's active session."""
+        app_folder = self._app_folders[app]
+        if os.path.exists(f"{app_folder}{os.sep}{session}"):
             try:
-                with open(marker_file, 'w') as f:
-                    f.write(datetime.now().isoformat())
+                with open(f"{app_folder}{os.sep}{ACTIVE_POINTER_FILE}", 'w', encoding='utf-8') as f:
+                    f.write(session)
             except (OSError, PermissionError):
                 pass  # Expected - permission issues
-        
-        self.refresh_list()
-        self.log(f"⭐ Active: {session}")
     
     def rename_session(self, app, old_name):
         """Rename session."""
         new_name, ok = DialogHelper.get_text(self, "Rename Session", "New name:", default=old_name)
         
         if ok and new_name and new_name != old_name:
-            old_path = os.path.join(self.session_backup_path, app, old_name)
-            new_path = os.path.join(self.session_backup_path, app, new_name)
+            old_path = self._session_path(app, old_name)
+            new_path = self._session_path(app, new_name)
             
             # Check if new name already exists
             if os.path.exists(new_path):
@@ -642,7 +1242,10 @@ class AccountTab(QWidget):
             if os.path.exists(old_path):
                 try:
                     os.rename(old_path, new_path)
-                    self.refresh_list()
+                    # Keep the active pointer on the renamed session
+                    if _read_active_session(self._app_folders[app]) == old_name:
+                        self._write_active_session(app, new_name)
+                    self.refresh_list(force=True)
                     self.log(f"✏️ Renamed: {old_name} → {new_name}")
                 except Exception as e:
                     self.log(f"❌ Rename failed: {e}")
@@ -659,16 +1262,19 @@ class AccountTab(QWidget):
     
     def delete_all_sessions(self):
         """Delete ALL backup sessions (wipe all data)."""
-        # Count total sessions
-        total = 0
-        for app in ['cursor', 'windsurf', 'claude']:
-            app_folder = os.path.join(self.session_backup_path, app)
+        # List sessions once; the same paths are counted and then deleted
+        session_paths = []
+        for app, app_folder in self._app_folders.items():
             if os.path.exists(app_folder):
                 try:
-                    total += len([d for d in os.listdir(app_folder) if os.path.isdir(os.path.join(app_folder, d))])
+                    with os.scandir(app_folder) as entries:
+                        session_paths.extend(
+                            entry.path for entry in entries if entry.is_dir(follow_symlinks=False)
+                        )
                 except PermissionError:
-                    pass
+                    self.log(f"⚠️ Cannot access {app} folder")
         
+        total = len(session_paths)
         if total == 0:
             DialogHelper.show_info(self, "No Sessions", "No backup sessions found.")
             return
@@ -685,25 +1291,17 @@ class AccountTab(QWidget):
         
         self.log(f"🗑️ Deleting ALL sessions...")
         
-        # Delete all sessions
-        deleted_count = 0
-        failed_count = 0
-        
-        for app in ['cursor', 'windsurf', 'claude']:
-            app_folder = os.path.join(self.session_backup_path, app)
-            if os.path.exists(app_folder):
-                try:
-                    for session_name in os.listdir(app_folder):
-                        session_path = os.path.join(app_folder, session_name)
-                        if os.path.isdir(session_path):
-                            try:
-                                shutil.rmtree(session_path)
-                                deleted_count += 1
-                            except Exception as e:
-                                failed_count += 1
-                                self.log(f"❌ Failed to delete {session_name}: {e}")
-                except PermissionError:
-                    self.log(f"⚠️ Cannot access {app} folder")
+        # Delete on the thread pool; the button stays disabled until it finishes
+        self.delete_all_btn.setEnabled(False)
+        runnable = DeleteAllSessionsRunnable(session_paths)
+        runnable.signals.finished.connect(self._on_all_sessions_deleted)
+        QThreadPool.globalInstance().start(runnable)
+    
+    @pyqtSlot(int, int, list)
+    def _on_all_sessions_deleted(self, deleted_count, failed_count, messages):
+        """Report the result of delete_all_sessions and refresh the list."""
+        for message in messages:
+            self.log(message)
         
         # Show summary
         if deleted_count > 0:
@@ -713,13 +1311,14 @@ class AccountTab(QWidget):
             self.log(f"⚠️ Failed to delete {failed_count} session(s)")
         
         # Refresh list
-        self.refresh_list()
+        self.refresh_list(force=True)
     
     def batch_delete_sessions(self):
         """Delete multiple selected sessions."""
         selected_rows = self.session_table.selectionModel().selectedRows()
         
-        if not selected_rows:
+        # One batch at a time; the counters belong to the running batch
+        if not selected_rows or self._batch_pending:
             return
         
         count = len(selected_rows)
@@ -732,58 +1331,92 @@ class AccountTab(QWidget):
         ):
             return
         
-        # Collect sessions to delete
-        sessions_to_delete = []
-        for index in selected_rows:
-            row = index.row()
-            app_item = self.session_table.item(row, 1)
-            name_item = self.session_table.item(row, 2)
-            
-            if app_item and name_item:
-                app = app_item.text().lower()
-                session = name_item.text().replace("⭐ ", "").split(" - ")[0]
-                sessions_to_delete.append((app, session))
-        
-        # Delete sessions
-        deleted_count = 0
-        failed_count = 0
-        
-        for app, session in sessions_to_delete:
-            path = os.path.join(self.session_backup_path, app, session)
-            if os.path.exists(path):
-                try:
-                    shutil.rmtree(path)
-                    deleted_count += 1
-                    self.log(f"🗑️ Deleted: {session}")
-                except Exception as e:
-                    failed_count += 1
-                    self.log(f"❌ Delete failed for {session}: {e}")
+        # Collect target paths in one pass; the set drops repeated sessions.
+        # No exists() probe; sessions already gone report FileNotFoundError
+        app_folders, sep = self._app_folders, os.sep
+        targets = sorted(
+            {f"{app_folders[app]}{sep}{session}"
+             for app, session in map(self._session_for_index, selected_rows)},
+            key=len, reverse=True  # deepest paths are queued first
+        )
+        
+        # Deletes run on the thread pool; results come back through _on_delete_finished
+        self._batch_pending = len(targets)
+        self._batch_deleted = 0
+        self._batch_failed = 0
+        self._batch_lines = []  # emitted as a single log entry
+        
+        progress = QProgressDialog("Deleting sessions...", "", 0, len(targets), self)
+        progress.setWindowTitle("Batch Delete")
+        progress.setWindowModality(Qt.WindowModality.WindowModal)
+        progress.setCancelButton(None)  # rmtree cannot be interrupted midway
+        apply_dark_theme(progress)
+        self._batch_progress = progress
+        self._progress_timer.start()
+        
+        pool = QThreadPool.globalInstance()
+        for path in targets:
+            runnable = SessionDeleteRunnable(path)
+            runnable.signals.finished.connect(self._on_delete_finished)
+            pool.start(runnable)
+    
+    @pyqtSlot(str, bool, object)
+    def _on_delete_finished(self, path, ok, error):
+        """Count one batch delete result; log and refresh once all are done."""
+        session = os.path.basename(path)
+        if ok:
+            self._batch_deleted += 1
+            self._batch_lines.append(f"🗑️ Deleted: {session}")
+        elif not isinstance(error, FileNotFoundError):
+            self._batch_failed += 1
+            self._batch_lines.append(f"❌ Delete failed for {session}: {error}")
+        
+        # The dialog is updated by _progress_timer, not once per result
+        self._batch_pending -= 1
+        if self._batch_pending:
+            return
+        self._progress_timer.stop()
+        self._update_batch_progress()  # reaching the maximum auto-closes the dialog
+        self._batch_progress = None
         
         # Show summary
-        if deleted_count > 0:
-            self.log(f"✅ Successfully deleted {deleted_count} session(s)")
-        if failed_count > 0:
-            self.log(f"⚠️ Failed to delete {failed_count} session(s)")
+        lines = self._batch_lines
+        if self._batch_deleted > 0:
+            lines.append(f"✅ Successfully deleted {self._batch_deleted} session(s)")
+        if self._batch_failed > 0:
+            lines.append(f"⚠️ Failed to delete {self._batch_failed} session(s)")
+        if lines:
+            self.log("\n".join(lines))
         
         # Refresh list
-        self.refresh_list()
+        self.refresh_list(force=True)
+    
+    def _update_batch_progress(self):
+        """Show the number of finished batch deletes on the progress dialog."""
+        progress = self._batch_progress
+        if progress is not None:
+            progress.setValue(progress.maximum() - self._batch_pending)
     
     def delete_session(self, app, session):
-        """Delete single session."""
+        """Delete single session on the thread pool."""
         if DialogHelper.confirm(self, "Confirm Delete", f"Delete session '{session}'?\n\nThis action cannot be undone."):
-            path = os.path.join(self.session_backup_path, app, session)
-            if os.path.exists(path):
-                try:
-                    shutil.rmtree(path)
-                    self.refresh_list()
-                    self.log(f"🗑️ Deleted: {session}")
-                except Exception as e:
-                    self.log(f"❌ Delete failed: {e}")
+            runnable = SessionDeleteRunnable(self._session_path(app, session))
+            runnable.signals.finished.connect(self._on_session_deleted)
+            QThreadPool.globalInstance().start(runnable)
+    
+    @pyqtSlot(str, bool, object)
+    def _on_session_deleted(self, path, ok, error):
+        """Report a single delete; refreshes are debounced by _refresh_timer."""
+        if ok:
+            self._refresh_timer.start()
+            self.log(f"🗑️ Deleted: {os.path.basename(path)}")
+        elif not isinstance(error, FileNotFoundError):  # Already gone otherwise
+            self.log(f"❌ Delete failed: {error}")
     
     def open_folder(self):
         """Open backup folder."""
         os.makedirs(self.session_backup_path, exist_ok=True)
-        if open_folder_in_explorer(self.session_backup_path):
+        if open_folder_in_explorer(_normalized(self.session_backup_path)):
             self.log(f"📁 Opened backup folder")
     
     def update_detected_apps(self, apps):
@@ -795,28 +1428,27 @@ class AccountTab(QWidget):
         try:
             # Always construct path for selected user (don't use config backup_location)
             # Use manual path construction to ensure correct path for ANY selected user
-            system_drive = os.getenv('SystemDrive', 'C:')
-            if not system_drive.endswith('\\'):
-                system_drive += '\\'
-            profile = os.path.join(system_drive, 'Users', username)
-            self.session_backup_path = os.path.join(profile, "Documents", "SurfManager", "Backups")
+            sep = os.sep
+            self.session_backup_path = f"{_SYSTEM_DRIVE}Users{sep}{username}{sep}{_BACKUP_SUBDIR}"
             
             # Update current user
             self.current_user = username
             
             # Try to create directory with permission handling
             try:
-                os.makedirs(self.session_backup_path, exist_ok=True)
+                # Switching between existing users costs one stat, not a mkdir walk
+                if not os.path.isdir(self.session_backup_path):
+                    os.makedirs(self.session_backup_path, exist_ok=True)
                 self.log(f"📂 Backup path updated for user: {username}")
                 self.log(f"   Path: {self.session_backup_path}")
             except PermissionError:
                 self.log(f"⚠️ Cannot access: {self.session_backup_path}")
                 self.log(f"⚠️ You may need administrator privileges to access this user's folder")
                 # Use current user's path as fallback
-                import getpass
-                self.current_user = getpass.getuser()
-                self.session_backup_path = os.path.join(os.path.expanduser("~"), "Documents", "SurfManager", "Backups")
-                os.makedirs(self.session_backup_path, exist_ok=True)
+                self.current_user = _CURRENT_USER
+                self.session_backup_path = f"{_HOME_DIR}{os.sep}{_BACKUP_SUBDIR}"
+                if not os.path.isdir(self.session_backup_path):
+                    os.makedirs(self.session_backup_path, exist_ok=True)
                 self.log(f"   Using fallback: {self.session_backup_path}")
             
             self.refresh_list()
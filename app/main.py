@@ -98,34 +98,30 @@ def main():
         # Loading steps
         if splash:
             splash.set_message("Loading configuration...")
-            splash.progress = 20
+            splash.set_progress(20)
             app.processEvents()
             
             splash.set_message("Initializing core modules...")
-            splash.progress = 40
+            splash.set_progress(40)
             app.processEvents()
         
-        # Initialize core modules
+        # Initialize core modules; backup/ID managers are built by the window on demand
         from app.core.app_manager import AppManager
-        from app.core.backup_manager import BackupManager
-        from app.core.id_manager import IdManager
         
         app_manager = AppManager()
-        backup_manager = BackupManager()
-        id_manager = IdManager()
         
         if splash:
             splash.set_message("Creating main window...")
-            splash.progress = 60
+            splash.set_progress(60)
             app.processEvents()
         
         debug_print("[DEBUG] Creating main window...")
-        window = MainWindow(app_manager, backup_manager, id_manager, config)
+        window = MainWindow(app_manager, config_manager=config)
         debug_print("[DEBUG] Main window created")
         
         if splash:
             splash.set_message("Scanning applications...")
-            splash.progress = 80
+            splash.set_progress(80)
             app.processEvents()
         
         # Scan for applications
@@ -133,7 +129,7 @@ def main():
         
         if splash:
             splash.set_message("Ready!")
-            splash.progress = 100
+            splash.set_progress(100)
             app.processEvents()
         
         # Close splash and show main window